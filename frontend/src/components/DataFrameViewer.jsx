@@ -8,6 +8,19 @@ const DEFAULT_COL_WIDTH = 120
 const ROW_NUM_WIDTH = 50
 const MAX_AUTO_LOAD = 1000  // Only auto-load up to this many rows
 
+// Rows are fetched column-major ({col: [values]}) - smaller payload - and zipped back into row objects
+const columnsToRows = (data) => {
+  const cols = Object.keys(data)
+  const length = cols.length ? data[cols[0]].length : 0
+  const rows = new Array(length)
+  for (let i = 0; i < length; i++) {
+    const row = {}
+    for (const col of cols) row[col] = data[col][i]
+    rows[i] = row
+  }
+  return rows
+}
+
 // Memoized row component for react-window
 const VirtualRow = memo(({ index, style, rows, columns, columnWidths, getColWidth, isCellSelected, handleCellMouseDown, handleCellMouseEnter }) => {
   const row = rows[index]
@@ -64,6 +77,7 @@ const DataFrameViewer = ({ content }) => {
   const containerRef = useRef(null)
   const headerRef = useRef(null)
   const listRef = useRef(null)
+  const scrollLeftRef = useRef(0)
   const [containerHeight, setContainerHeight] = useState(400)
 
   // columnInfo state - initialized from props, updated by cascading filters
@@ -105,6 +119,20 @@ const DataFrameViewer = ({ content }) => {
     }
   }, [isFullscreen])
 
+  // Columns currently scrolled into view - filter/sort queries only compute columnInfo for these
+  const getVisibleColumns = useCallback(() => {
+    const left = scrollLeftRef.current
+    const right = left + (containerRef.current?.offsetWidth || 0)
+    const visible = []
+    let x = ROW_NUM_WIDTH
+    for (const col of columns) {
+      const width = columnWidths[col] || DEFAULT_COL_WIDTH
+      if (x + width > left && x < right) visible.push(col)
+      x += width
+    }
+    return visible
+  }, [columns, columnWidths])
+
   // Manual load more rows - no automatic loading
   const loadMoreRows = useCallback(async () => {
     if (isLoadingMore || !filePath || rows.length >= totalRows) return
@@ -113,13 +141,14 @@ const DataFrameViewer = ({ content }) => {
 
     try {
       const res = await fetch(
-        `/api/dataframe/rows?filePath=${encodeURIComponent(filePath)}&offset=${rows.length}&limit=${CHUNK_SIZE}`
+        `/api/dataframe/rows?filePath=${encodeURIComponent(filePath)}&offset=${rows.length}&limit=${CHUNK_SIZE}&layout=columns`
       )
 
       if (res.ok) {
         const data = await res.json()
-        if (data.data && data.data.length > 0) {
-          setRows(prev => [...prev, ...data.data])
+        const newRows = data.data ? columnsToRows(data.data) : []
+        if (newRows.length > 0) {
+          setRows(prev => [...prev, ...newRows])
           setTotalRows(data.totalRows)
         }
       }
@@ -141,17 +170,19 @@ const DataFrameViewer = ({ content }) => {
         body: JSON.stringify({
           filePath,
           filters: newFilters,
-          sort: newSort.column ? newSort : null
+          sort: newSort.column ? newSort : null,
+          layout: 'columns',
+          columns: getVisibleColumns()
         })
       })
 
       if (res.ok) {
         const data = await res.json()
-        setRows(data.data)
+        setRows(columnsToRows(data.data))
         setTotalRows(data.totalRows)
-        // Update columnInfo with cascading filter options
+        // Update columnInfo with cascading filter options (off-screen columns refresh when their filter opens)
         if (data.columnInfo) {
-          setColumnInfo(data.columnInfo)
+          setColumnInfo(prev => ({ ...prev, ...data.columnInfo }))
         }
         if (listRef.current) {
           listRef.current.scrollToRow({ index: 0 })
@@ -160,6 +191,24 @@ const DataFrameViewer = ({ content }) => {
     } catch (err) {
       console.error('Failed to apply filter/sort:', err)
     }
+  }, [filePath, getVisibleColumns])
+
+  // Fetch stats for a single column when its filter panel opens
+  const loadColumnInfo = useCallback(async (col) => {
+    if (!filePath) return
+
+    try {
+      const res = await fetch(`/api/dataframe/column-info?column=${encodeURIComponent(col)}`)
+
+      if (res.ok) {
+        const data = await res.json()
+        if (data.columnInfo) {
+          setColumnInfo(prev => ({ ...prev, [col]: data.columnInfo }))
+        }
+      }
+    } catch (err) {
+      console.error('Failed to load column info:', err)
+    }
   }, [filePath])
 
   // Close dropdown when clicking outside
@@ -342,6 +391,7 @@ const DataFrameViewer = ({ content }) => {
     }
     setActiveFilter(col)
     setFilterSearch('')
+    loadColumnInfo(col)
   }
 
   const applyFilter = async (col) => {
@@ -437,6 +487,9 @@ const DataFrameViewer = ({ content }) => {
     if (headerRef.current && e.target) {
       headerRef.current.scrollLeft = e.target.scrollLeft
     }
+    if (e.target) {
+      scrollLeftRef.current = e.target.scrollLeft
+    }
   }, [])
 
   const containerClass = `dataframe-container ${isFullscreen ? 'fullscreen' : ''}`
@@ -58,7 +58,7 @@ const FileIcon = ({ extension, isDirectory }) => {
 
   const ext = extension?.toLowerCase()
 
-  if (['.csv', '.xlsx', '.xls', '.parquet'].includes(ext)) {
+  if (['.csv', '.xlsx', '.xls', '.parquet', '.geoparquet'].includes(ext)) {
     return <SpreadsheetIcon />
   }
   if (ext === '.py') {
@@ -6,6 +6,9 @@ import '@xterm/xterm/css/xterm.css'
 
 const FONT_SIZE = 14
 
+// Terminal input/output travels as binary frames of raw UTF-8 bytes; text frames are JSON control messages
+const textEncoder = new TextEncoder()
+
 function LocalTerminal({ projectPath, onTerminalActivity }) {
   const terminalRef = useRef(null)
   const xtermRef = useRef(null)
@@ -101,7 +104,7 @@ function LocalTerminal({ projectPath, onTerminalActivity }) {
       if ((event.ctrlKey || event.metaKey) && event.key === 'v' && event.type === 'keydown') {
         navigator.clipboard.readText().then(text => {
           if (text && wsRef.current?.readyState === WebSocket.OPEN) {
-            wsRef.current.send(text)
+            wsRef.current.send(textEncoder.encode(text))
           }
         })
         return false
@@ -130,6 +133,7 @@ function LocalTerminal({ projectPath, onTerminalActivity }) {
 
       setConnectionStatus('connecting')
       const ws = new WebSocket(wsUrl)
+      ws.binaryType = 'arraybuffer'
       wsRef.current = ws
 
       ws.onopen = () => {
@@ -143,11 +147,11 @@ function LocalTerminal({ projectPath, onTerminalActivity }) {
           hasInitializedRef.current = true
           setTimeout(() => {
             if (ws.readyState === WebSocket.OPEN) {
-              ws.send(`cd "${projectPath}" && clear\n`)
+              ws.send(textEncoder.encode(`cd "${projectPath}" && clear\n`))
               // Launch claude after a short delay
               setTimeout(() => {
                 if (ws.readyState === WebSocket.OPEN) {
-                  ws.send('claude\n')
+                  ws.send(textEncoder.encode('claude\n'))
                 }
               }, 500)
             }
@@ -156,8 +160,13 @@ function LocalTerminal({ projectPath, onTerminalActivity }) {
       }
 
       ws.onmessage = (event) => {
-        if (event.data === '{"type":"pong"}') return
-        xterm.write(event.data)
+        if (typeof event.data === 'string') {
+          if (event.data === '{"type":"pong"}') return
+          xterm.write(event.data)
+        } else {
+          // xterm decodes UTF-8 itself, including sequences split across frames
+          xterm.write(new Uint8Array(event.data))
+        }
         if (onTerminalActivity) onTerminalActivity()
       }
 
@@ -178,7 +187,7 @@ function LocalTerminal({ projectPath, onTerminalActivity }) {
     // Handle keyboard input
     const inputDisposable = xterm.onData((data) => {
       if (wsRef.current?.readyState === WebSocket.OPEN) {
-        wsRef.current.send(data)
+        wsRef.current.send(textEncoder.encode(data))
       }
     })
 
@@ -211,7 +220,7 @@ function LocalTerminal({ projectPath, onTerminalActivity }) {
   const handlePaste = () => {
     navigator.clipboard.readText().then(text => {
       if (text && wsRef.current?.readyState === WebSocket.OPEN) {
-        wsRef.current.send(text)
+        wsRef.current.send(textEncoder.encode(text))
       }
     })
     setContextMenu(null)
@@ -3,6 +3,7 @@ Script discovery and execution
 """
 
 import sys
+import asyncio
 import subprocess
 import signal
 import re
@@ -16,6 +17,8 @@ from typing import Optional
 running_processes: list[subprocess.Popen] = []
 # Track Streamlit processes separately (they run in background)
 streamlit_processes: dict[str, subprocess.Popen] = {}  # script_path -> process
+# Track scripts started by run_script_async (asyncio subprocesses)
+async_processes: dict[int, tuple[str, asyncio.subprocess.Process]] = {}  # pid -> (script_path, process)
 
 
 @dataclass
@@ -274,6 +277,80 @@ def run_script(script_path: Path, project_folder: Path, timeout: int = 300) -> S
         )
 
 
+async def run_script_async(script_path: Path, project_folder: Path, timeout: int = 300) -> ScriptResult:
+    """
+    Execute a Python script as an asyncio subprocess. Unlike run_script, no worker
+    thread is held for the lifetime of the script.
+
+    Args:
+        script_path: Path to the script
+        project_folder: Working directory for execution
+        timeout: Maximum execution time in seconds (default 5 minutes)
+
+    Returns:
+        ScriptResult with execution details
+    """
+    if not script_path.exists():
+        return ScriptResult(
+            script_path=str(script_path),
+            success=False,
+            stdout="",
+            stderr="",
+            return_code=-1,
+            error=f"Script not found: {script_path}"
+        )
+
+    # Streamlit startup blocks while watching output for the URL - keep it on a thread
+    if is_streamlit_script(script_path):
+        return await asyncio.to_thread(run_streamlit_script, script_path, project_folder)
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, str(script_path),
+            cwd=str(project_folder),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+    except NotImplementedError:
+        # Event loop without subprocess support (e.g. Windows selector loop)
+        return await asyncio.to_thread(run_script, script_path, project_folder, timeout)
+    except Exception as e:
+        return ScriptResult(
+            script_path=str(script_path),
+            success=False,
+            stdout="",
+            stderr="",
+            return_code=-1,
+            error=str(e)
+        )
+
+    async_processes[process.pid] = (str(script_path), process)
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        process.kill()
+        await process.wait()  # Clean up
+        return ScriptResult(
+            script_path=str(script_path),
+            success=False,
+            stdout="",
+            stderr="",
+            return_code=-1,
+            error=f"Script timed out after {timeout} seconds",
+            timed_out=True
+        )
+    finally:
+        async_processes.pop(process.pid, None)
+
+    return ScriptResult(
+        script_path=str(script_path),
+        success=process.returncode == 0,
+        stdout=stdout.decode("utf-8", errors="replace"),
+        stderr=stderr.decode("utf-8", errors="replace"),
+        return_code=process.returncode
+    )
+
+
 def stop_all_scripts() -> int:
     """
     Stop all currently running scripts, including Streamlit apps.
@@ -313,6 +390,15 @@ def stop_all_scripts() -> int:
             if script_key in streamlit_processes:
                 del streamlit_processes[script_key]
 
+    # Stop asyncio script processes - run_script_async reaps them once they exit
+    for pid, (_, process) in list(async_processes.items()):
+        try:
+            process.terminate()
+            stopped += 1
+        except ProcessLookupError:
+            pass  # Process already exited
+        async_processes.pop(pid, None)
+
     return stopped
 
 
@@ -355,6 +441,17 @@ def list_running_processes() -> list[dict]:
         else:
             running_processes.remove(process)
 
+    # Check asyncio script processes
+    for pid, (script_path, process) in list(async_processes.items()):
+        if process.returncode is None:
+            processes.append({
+                "pid": pid,
+                "script_path": script_path,
+                "script_name": Path(script_path).name,
+                "type": "python",
+                "status": "running"
+            })
+
     return processes
 
 
@@ -399,6 +496,15 @@ def stop_process(pid: int) -> bool:
             except Exception:
                 return False
 
+    # Check asyncio script processes
+    if pid in async_processes:
+        _, process = async_processes.pop(pid)
+        try:
+            process.terminate()
+            return True
+        except ProcessLookupError:
+            return False
+
     # Try to kill by PID directly as fallback
     try:
         os.kill(pid, signal.SIGTERM)
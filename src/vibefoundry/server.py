@@ -4,63 +4,111 @@ FastAPI backend server for VibeFoundry IDE
 
 import os
 import sys
+import io
+import re
+import hashlib
 import json
 import asyncio
+import logging
 import struct
 import signal
+import stat
 import time
 from pathlib import Path
+from concurrent.futures import Executor, ThreadPoolExecutor
 
 # Unix-only imports for terminal functionality
 if sys.platform != 'win32':
     import pty
     import fcntl
     import termios
-    import select
 else:
     pty = None
     fcntl = None
     termios = None
-    select = None
 from typing import Optional
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 
 import httpx
+import orjson
+
+# Cap Polars' thread pool before it is created at import - the same process also serves
+# terminals, file trees and API requests. An explicit POLARS_MAX_THREADS still wins.
+os.environ.setdefault("POLARS_MAX_THREADS", str(min(8, os.cpu_count() or 4)))
 import polars as pl
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, UploadFile, File, Form
+
+# pyarrow is optional - when installed, Parquet footers are read directly for schema/row count
+try:
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pq = None
+    PYARROW_AVAILABLE = False
+
+# h2 is optional - when installed (httpx[http2]), codespace sync multiplexes requests over one connection
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, UploadFile, File, Form, Query, Header
 from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from vibefoundry.runner import discover_scripts, run_script, setup_project_structure, ScriptResult, stop_all_scripts, list_running_processes, stop_process
+from vibefoundry.runner import discover_scripts, run_script_async, setup_project_structure, ScriptResult, stop_all_scripts, list_running_processes, stop_process
 from vibefoundry.metadata import generate_metadata
 from vibefoundry.watcher import FileWatcher
 
 
 # Global state
 class AppState:
-    project_folder: Optional[Path] = None
+    _project_folder: Optional[Path] = None
+    # Resolved once per folder selection, for the per-request path containment checks
+    project_folder_resolved: Optional[Path] = None
     watcher: Optional[FileWatcher] = None
     websocket_clients: list[WebSocket] = []
     # Debounce for script change notifications (prevent duplicates)
-    last_script_change: dict[str, float] = {}  # path -> timestamp
+    # Shared HTTP client for codespace sync and GitHub calls - keeps connections warm
+    http: Optional[httpx.AsyncClient] = None
+    http_loop: Optional[asyncio.AbstractEventLoop] = None
+    # Ordered oldest-first, so expired entries are popped from the front
+    last_script_change: OrderedDict[str, float] = OrderedDict()  # path -> timestamp
+
+    @property
+    def project_folder(self) -> Optional[Path]:
+        return self._project_folder
+
+    @project_folder.setter
+    def project_folder(self, folder: Optional[Path]):
+        self._project_folder = folder
+        self.project_folder_resolved = folder.resolve() if folder is not None else None
 
 
 class DataFrameState:
     """Stream-from-disk DataFrame viewer - only loads rows as needed"""
     def __init__(self):
         self.file_path: Optional[str] = None
-        self.file_type: Optional[str] = None  # 'csv' or 'excel'
+        self.file_type: Optional[str] = None  # 'csv', 'excel' or 'parquet'
         self.csv_separator: str = ','
         self.columns: list[str] = []
         self.column_info: dict = {}  # {col: {type, min, max, values}}
+        # Column dtype classification, computed once when the file is opened
+        self._numeric_cols: set[str] = set()
+        self._categorical_cols: set[str] = set()
         self.total_rows: int = 0
-        self.current_filters: dict = {}
+        self._filters: dict = {}
         self.current_sort: Optional[dict] = None
         # Small cache for filtered row count (avoids re-scanning)
         self._filtered_row_count: Optional[int] = None
+        # Lazy frame + schema reused across requests, keyed by (file_path, mtime, file_type, csv_separator)
+        self._lf_cache: dict[tuple, tuple[pl.LazyFrame, pl.Schema]] = {}
+        # Parquet footer (pyarrow FileMetaData) and the mtime it was read at
+        self._parquet_metadata = None
+        self._parquet_metadata_mtime: float = 0.0
 
     def clear(self):
         """Clear state"""
@@ -70,18 +118,143 @@ class DataFrameState:
         self.csv_separator = ','
         self.columns = []
         self.column_info = {}
+        self._numeric_cols = set()
+        self._categorical_cols = set()
         self.total_rows = 0
         self.current_filters = {}
         self.current_sort = None
         self._filtered_row_count = None
+        self._lf_cache = {}
+        self._parquet_metadata = None
+        self._parquet_metadata_mtime = 0.0
+
+    def classify_columns(self, schema, skip: frozenset = frozenset()) -> dict:
+        """Split columns into numeric/categorical once per file open and return
+        placeholder column info (stats are computed lazily when the user filters).
+        Columns in `skip` (e.g. GeoParquet geometry blobs) get no filter info at all."""
+        self._numeric_cols = set()
+        self._categorical_cols = set()
+        column_info = {}
+        for col in self.columns:
+            dtype = schema.get(col)
+            if dtype is None or col in skip:
+                continue
+            if dtype.is_numeric():
+                self._numeric_cols.add(col)
+                column_info[col] = {"type": "numeric", "min": 0, "max": 0}
+            else:
+                self._categorical_cols.add(col)
+                column_info[col] = {"type": "categorical", "values": []}
+        return column_info
+
+    @property
+    def current_filters(self) -> dict:
+        return self._filters
+
+    @current_filters.setter
+    def current_filters(self, filters: dict):
+        """Replacing the filters drops the cached filtered row count so it can't go stale.
+        (Sort changes don't affect the count, so current_sort stays a plain attribute.)"""
+        self._filters = filters
+        self._filtered_row_count = None
 
-    def _get_lazy_frame(self) -> Optional[pl.LazyFrame]:
-        """Get a lazy frame for the file (doesn't load data)"""
+    def _cache_key(self) -> Optional[tuple]:
+        """Key for the lazy frame cache, or None if there is no readable file"""
         if not self.file_path:
             return None
+        try:
+            mtime = os.stat(self.file_path).st_mtime
+        except OSError:
+            return None
+        return (self.file_path, mtime, self.file_type, self.csv_separator)
+
+    def _get_cached_frame(self) -> Optional[tuple[pl.LazyFrame, pl.Schema]]:
+        """Get (lazy frame, schema) for the file, building them only when the key changes"""
+        key = self._cache_key()
+        if key is None:
+            return None
+        cached = self._lf_cache.get(key)
+        if cached is None:
+            lf = self._build_lazy_frame()
+            if lf is None:
+                return None
+            cached = (lf, lf.collect_schema())
+            # Only the open file is ever read, so a new key replaces the old entry
+            self._lf_cache = {key: cached}
+        return cached
+
+    def _get_lazy_frame(self) -> Optional[pl.LazyFrame]:
+        """Get a lazy frame for the file (doesn't load data).
+        Cached per file mtime so schema inference isn't repeated on every paginate."""
+        cached = self._get_cached_frame()
+        return cached[0] if cached else None
+
+    @property
+    def schema(self) -> Optional[pl.Schema]:
+        """Schema of the unfiltered file, from the same cache as the lazy frame"""
+        cached = self._get_cached_frame()
+        return cached[1] if cached else None
+
+    def cache_lazy_frame(self, lf: pl.LazyFrame, schema: Optional[pl.Schema] = None):
+        """Seed the lazy frame cache with a frame that was already built (e.g. a parsed Excel sheet)"""
+        key = self._cache_key()
+        if key is None:
+            return
+        self._lf_cache = {key: (lf, schema if schema is not None else lf.collect_schema())}
+
+    def cache_parquet_metadata(self, metadata):
+        """Keep the parsed Parquet footer so later passes don't re-read it"""
+        try:
+            self._parquet_metadata_mtime = os.stat(self.file_path).st_mtime
+        except OSError:
+            return
+        self._parquet_metadata = metadata
+
+    def footer_min_max(self, columns: list[str]) -> dict:
+        """Min/max for unfiltered numeric Parquet columns from row group statistics.
+        Returns {col: (min, max)} only for columns every row group has plain int/float stats for."""
+        metadata = self._parquet_metadata
+        if metadata is None or self.current_filters:
+            return {}
+        try:
+            if os.stat(self.file_path).st_mtime != self._parquet_metadata_mtime:
+                return {}
+        except OSError:
+            return {}
+
+        wanted = set(columns)
+        bounds = {}
+        skipped = set()
+        for rg in range(metadata.num_row_groups):
+            row_group = metadata.row_group(rg)
+            for i in range(row_group.num_columns):
+                chunk = row_group.column(i)
+                col = chunk.path_in_schema
+                if col not in wanted or col in skipped:
+                    continue
+                stats = chunk.statistics
+                if (stats is None or not stats.has_min_max
+                        or stats.physical_type not in ('INT32', 'INT64', 'FLOAT', 'DOUBLE')
+                        or stats.logical_type.type not in ('NONE', 'INT')):
+                    skipped.add(col)
+                    bounds.pop(col, None)
+                    continue
+                lo, hi = stats.min, stats.max
+                if col in bounds:
+                    lo = min(lo, bounds[col][0])
+                    hi = max(hi, bounds[col][1])
+                bounds[col] = (lo, hi)
+        # A column missing from any row group can't be trusted either
+        return {col: b for col, b in bounds.items() if col not in skipped}
+
+    def _build_lazy_frame(self) -> Optional[pl.LazyFrame]:
+        """Build a fresh lazy frame for the current file"""
         file_path = Path(self.file_path)
         if self.file_type == 'csv':
             return pl.scan_csv(file_path, separator=self.csv_separator, infer_schema_length=10000)
+        elif self.file_type == 'parquet':
+            # Column-parallel reads + row-group pruning from pushed-down predicates
+            return pl.scan_parquet(file_path, parallel="columns")
         elif self.file_type == 'excel':
             # Excel doesn't support lazy scanning, load eagerly but this is rare
             return pl.read_excel(file_path).lazy()
@@ -89,30 +262,43 @@ class DataFrameState:
 
     def _apply_filters_sort(self, lf: pl.LazyFrame) -> pl.LazyFrame:
         """Apply current filters and sort to a lazy frame"""
-        # Apply filters
+        return self._apply_sort(self._apply_filters(lf))
+
+    def _apply_filters(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Apply current filters to a lazy frame"""
+        # Collect filter predicates, applied as one filter below
+        predicates = []
         for column, filter_val in self.current_filters.items():
             if column not in self.columns:
                 continue
             if isinstance(filter_val, dict):
-                # Numeric range filter
+                # Numeric range filter - compare numeric columns directly so the predicate
+                # can be pushed into the scan (a cast wrapper blocks Parquet row-group pruning)
+                if column in self._numeric_cols:
+                    col_expr = pl.col(column)
+                else:
+                    col_expr = pl.col(column).cast(pl.Float64, strict=False)
                 if filter_val.get('min') not in (None, '', 'null'):
                     try:
-                        min_val = float(filter_val['min'])
-                        lf = lf.filter(pl.col(column).cast(pl.Float64, strict=False) >= min_val)
+                        predicates.append(col_expr >= float(filter_val['min']))
                     except (ValueError, TypeError):
                         pass
                 if filter_val.get('max') not in (None, '', 'null'):
                     try:
-                        max_val = float(filter_val['max'])
-                        lf = lf.filter(pl.col(column).cast(pl.Float64, strict=False) <= max_val)
+                        predicates.append(col_expr <= float(filter_val['max']))
                     except (ValueError, TypeError):
                         pass
             elif isinstance(filter_val, list) and len(filter_val) > 0:
                 # Categorical filter
                 str_vals = [str(v) for v in filter_val]
-                lf = lf.filter(pl.col(column).cast(pl.Utf8).is_in(str_vals))
+                predicates.append(pl.col(column).cast(pl.Utf8).is_in(str_vals))
+
+        if predicates:
+            lf = lf.filter(*predicates)
+        return lf
 
-        # Apply sort
+    def _apply_sort(self, lf: pl.LazyFrame) -> pl.LazyFrame:
+        """Apply current sort to a lazy frame"""
         if self.current_sort and self.current_sort.get('column'):
             sort_col = self.current_sort['column']
             descending = self.current_sort.get('direction', 'asc') != 'asc'
@@ -121,39 +307,240 @@ class DataFrameState:
 
         return lf
 
-    def get_rows(self, offset: int, limit: int) -> tuple[list[dict], int]:
-        """Get rows with current filters/sort applied. Returns (rows, total_filtered_count)"""
+    def get_rows(self, offset: int, limit: int, visible_columns: Optional[list[str]] = None) -> tuple[pl.DataFrame, int]:
+        """Get rows with current filters/sort applied. Returns (rows_df, total_filtered_count)
+
+        If visible_columns is given, only those columns are read from disk (projection pushdown).
+        Null strings are filled with ''; other nulls are left for the JSON encoder to emit as null."""
         lf = self._get_lazy_frame()
         if lf is None:
-            return [], 0
+            return pl.DataFrame(), 0
 
         lf = self._apply_filters_sort(lf)
 
         # Get total count (cached if no filter changes)
         if self._filtered_row_count is None:
-            self._filtered_row_count = lf.select(pl.len()).collect().item()
+            if not self.current_filters and self.total_rows:
+                # Sorting doesn't change the count - reuse the one taken at file open
+                self._filtered_row_count = self.total_rows
+            else:
+                # Streaming engine answers a bare len() query without materializing rows
+                self._filtered_row_count = lf.select(pl.len()).collect(engine="streaming").item()
+
+        if visible_columns:
+            visible_columns = [c for c in visible_columns if c in self.columns]
 
         # Get requested slice
-        rows_df = lf.slice(offset, limit).collect()
-        rows = rows_df.to_dicts()
+        has_sort = bool(self.current_sort and self.current_sort.get('column'))
+        if self.file_type == 'csv' and not self.current_filters and not has_sort:
+            rows_df = self._read_csv_window(offset, limit, visible_columns)
+        else:
+            # Project after filter/sort so predicates can still reference hidden columns
+            if visible_columns:
+                lf = lf.select(visible_columns)
+            rows_df = lf.slice(offset, limit).collect()
 
-        # Replace None with empty string
-        for row in rows:
-            for key in row:
-                if row[key] is None:
-                    row[key] = ''
+        return self._finish_rows(rows_df), self._filtered_row_count
 
-        return rows, self._filtered_row_count
+    def get_first_page_with_stats(self, limit: int, stats_exprs: list[pl.Expr]) -> tuple[pl.DataFrame, int, Optional[pl.DataFrame]]:
+        """First page, filtered row count and column stats for the current filters/sort.
+        Returns (rows_df, total_filtered_count, stats_df or None)."""
+        lf = self._get_lazy_frame()
+        if lf is None:
+            return pl.DataFrame(), 0, None
 
-    def invalidate_filter_cache(self):
-        """Call when filters change"""
-        self._filtered_row_count = None
+        # Stats and count don't depend on order - only the page is sorted
+        filtered = self._apply_filters(lf)
+        queries = [self._apply_sort(filtered).slice(0, limit)]
+
+        if self._filtered_row_count is None and not self.current_filters and self.total_rows:
+            self._filtered_row_count = self.total_rows
+        need_count = self._filtered_row_count is None
+        if need_count:
+            queries.append(filtered.select(pl.len()))
+        if stats_exprs:
+            queries.append(filtered.select(stats_exprs))
+
+        if self.current_sort and self.current_sort.get('column'):
+            # The sort materializes the filtered frame anyway - one pl.collect_all lets the
+            # count and stats share it instead of scanning the file three times
+            results = pl.collect_all(queries)
+        else:
+            # Nothing forces the filtered frame into memory. A fused collect would cache the shared
+            # filtered subplan in full, so the page is sliced on its own and count/stats stream.
+            results = [queries[0].collect()] + [q.collect(engine="streaming") for q in queries[1:]]
+        rows_df = results[0]
+        if need_count:
+            self._filtered_row_count = results[1].item()
+        stats_df = results[-1] if stats_exprs else None
+        return self._finish_rows(rows_df), self._filtered_row_count, stats_df
+
+    def _finish_rows(self, rows_df: pl.DataFrame) -> pl.DataFrame:
+        """Make a page of rows JSON-ready"""
+        # Null strings become '' (the viewer renders null cells as '' too) - other columns keep null
+        str_cols = [c for c, dtype in rows_df.schema.items() if dtype == pl.Utf8]
+
+        # Binary and temporal values (at any nesting depth) get the same JSON form the
+        # Python encoder gave them - write_json can't write nested Binary at all
+        converted = []
+        for c, dtype in rows_df.schema.items():
+            expr = json_ready_expr(pl.col(c), dtype)
+            if expr is not None:
+                converted.append(expr.alias(c))
+        if converted:
+            rows_df = rows_df.with_columns(converted)
+
+        if str_cols:
+            rows_df = rows_df.with_columns(pl.col(str_cols).fill_null(""))
+
+        return rows_df
+
+    def _read_csv_window(self, offset: int, limit: int, visible_columns: Optional[list[str]] = None) -> pl.DataFrame:
+        """Read one page of an unfiltered, unsorted CSV.
+        Parsing stops after offset+limit rows, so memory is bounded by the page rather than the file."""
+        return pl.read_csv(
+            self.file_path,
+            separator=self.csv_separator,
+            schema=self.schema,
+            columns=visible_columns or None,
+            skip_rows_after_header=offset,
+            n_rows=limit,
+        )
 
 
 state = AppState()
 df_state = DataFrameState()
 
 
+# Non-str dict keys (int, float, None, ...) are coerced to strings, as the stdlib encoder did
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson - several times faster than the stdlib encoder on row payloads"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+def iso_string_expr(expr: pl.Expr, fmt: str, tz_suffix: str = "") -> pl.Expr:
+    """Format datetimes/times like isoformat(): microseconds only when non-zero"""
+    return (
+        pl.when(expr.dt.nanosecond() < 1000)
+        .then(expr.dt.to_string(fmt + tz_suffix))
+        .otherwise(expr.dt.to_string(fmt + "%.6f" + tz_suffix))
+    )
+
+
+def json_ready_expr(expr: pl.Expr, dtype: pl.DataType) -> Optional[pl.Expr]:
+    """Expression converting a column of this dtype to what jsonable_encoder would have produced:
+    binary as hex (e.g. GeoParquet WKB geometry), datetimes/times as ISO strings, durations as
+    seconds, decimals as floats. Returns None if the dtype needs no conversion."""
+    if dtype == pl.Binary:
+        return expr.bin.encode("hex")
+    if dtype == pl.Datetime:
+        return iso_string_expr(expr, "%Y-%m-%dT%H:%M:%S", "%:z" if dtype.time_zone else "")
+    if dtype == pl.Time:
+        return iso_string_expr(expr, "%H:%M:%S")
+    if dtype == pl.Duration:
+        return expr.dt.total_microseconds() / 1_000_000
+    if dtype == pl.Decimal:
+        return expr.cast(pl.Float64)
+    if isinstance(dtype, (pl.List, pl.Array)):
+        inner = json_ready_expr(pl.element(), dtype.inner)
+        if inner is None:
+            return None
+        if isinstance(dtype, pl.Array):
+            expr = expr.cast(pl.List(dtype.inner))
+        return expr.list.eval(inner)
+    if isinstance(dtype, pl.Struct):
+        fields = [(field, json_ready_expr(expr.struct.field(field.name), field.dtype)) for field in dtype.fields]
+        if all(converted is None for _, converted in fields):
+            return None
+        return pl.struct([
+            (converted if converted is not None else expr.struct.field(field.name)).alias(field.name)
+            for field, converted in fields
+        ])
+    return None
+
+
+def rows_json_response(payload: dict, rows_df: pl.DataFrame, layout: str = "rows") -> Response:
+    """JSON response whose "data" field is the rows serialized by Polars.
+    The rows are spliced into the orjson-encoded envelope as-is, never materialized as Python dicts.
+
+    layout="rows" gives a list of row objects; layout="columns" gives {col: [values...]},
+    which doesn't repeat every column name on every row."""
+    if layout == "columns":
+        payload = {**payload, "layout": "columns"}
+        # Imploding every column gives a single row of lists - Polars writes it as [{...}]
+        data = rows_df.select(pl.all().implode()).write_json()[1:-1] if rows_df.width else "{}"
+    else:
+        data = rows_df.write_json()
+    envelope = orjson.dumps(payload, option=ORJSON_OPTIONS)[:-1]
+    if payload:
+        envelope += b","
+    body = envelope + b'"data":' + data.encode() + b"}"
+    return Response(content=body, media_type="application/json")
+
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def rows_arrow_response(rows_df: pl.DataFrame, headers: dict) -> Response:
+    """Arrow IPC stream response for a page of rows - columnar, no per-cell Python objects.
+    Uncompressed, since arrow-js can't read compressed IPC buffers."""
+    buf = io.BytesIO()
+    rows_df.write_ipc_stream(buf, compression="uncompressed")
+    return Response(content=buf.getvalue(), media_type=ARROW_STREAM_MEDIA_TYPE, headers=headers)
+
+
+# Magic numbers of common binary containers: zip (docx/xlsx/pptx/jar), OLE2 (doc/xls/ppt), ELF, PDF, gzip
+BINARY_MAGICS = (b'PK\x03\x04', b'\xd0\xcf\x11\xe0', b'\x7fELF', b'%PDF', b'\x1f\x8b')
+BINARY_SNIFF_SIZE = 512
+
+
+def is_binary_head(head: bytes) -> bool:
+    """True if the first bytes of a file mark it as binary (known magic number or a NUL byte)"""
+    return head.startswith(BINARY_MAGICS) or b'\x00' in head
+
+
+# Multiple of 3 bytes, so each block base64-encodes without padding and the pieces concatenate
+BASE64_BLOCK_SIZE = 57 * 1024
+
+
+def base64_json_response(file_path: Path) -> StreamingResponse:
+    """{"content", "encoding": "base64", "filename"} response for a binary file, encoded block by block.
+    Memory stays at one block instead of the whole file plus its base64 copy."""
+    import base64
+
+    def generate():
+        yield orjson.dumps({"encoding": "base64", "filename": file_path.name})[:-1] + b',"content":"'
+        with open(file_path, 'rb') as f:
+            while chunk := f.read(BASE64_BLOCK_SIZE):
+                yield base64.b64encode(chunk)
+        yield b'"}'
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
+def check_in_project(path: Path) -> Path:
+    """Resolve `path` and raise 403 unless it lies inside the project folder.
+    The project folder's own resolution is cached on state, so only `path` is resolved here."""
+    resolved = path.resolve()
+    try:
+        resolved.relative_to(state.project_folder_resolved)
+    except ValueError:
+        raise HTTPException(status_code=403, detail="Access denied")
+    return resolved
+
+
+def _safe_join(rel: str) -> Path:
+    """Join a client-supplied relative path onto the project folder, rejecting escapes"""
+    path = state.project_folder / rel
+    check_in_project(path)
+    return path
+
+
 # Request/Response models
 class FolderSelectRequest(BaseModel):
     path: str
@@ -161,6 +548,7 @@ class FolderSelectRequest(BaseModel):
 
 class RunScriptsRequest(BaseModel):
     scripts: list[str]
+    concurrent: bool = False  # Opt-in: only for scripts that don't read each other's outputs
 
 
 class ScriptResultResponse(BaseModel):
@@ -174,6 +562,24 @@ class ScriptResultResponse(BaseModel):
     streamlit_url: Optional[str] = None  # URL if this was a Streamlit app
 
 
+# Max concurrent requests to the codespace during a sync
+SYNC_CONCURRENCY = 16
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient, creating it on first use.
+    A client is tied to the event loop it was created on, so a new loop gets a new client."""
+    loop = asyncio.get_running_loop()
+    if state.http is None or state.http.is_closed or state.http_loop is not loop:
+        state.http = httpx.AsyncClient(
+            timeout=30.0,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=SYNC_CONCURRENCY * 2, max_connections=64),
+        )
+        state.http_loop = loop
+    return state.http
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events"""
@@ -190,8 +596,11 @@ async def lifespan(app: FastAPI):
 
     yield
     # Cleanup
+    if state.http is not None:
+        await state.http.aclose()
+        state.http = None
     if state.watcher:
-        state.watcher.stop()
+        await state.watcher.stop_async()
     # Stop any running scripts (including Streamlit apps)
     stopped = stop_all_scripts()
     if stopped:
@@ -202,7 +611,8 @@ async def lifespan(app: FastAPI):
 app = FastAPI(
     title="VibeFoundry IDE",
     version="0.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS for development
@@ -373,17 +783,25 @@ async def list_scripts():
 
 @app.post("/api/scripts/run")
 async def run_scripts(request: RunScriptsRequest):
-    """Run selected scripts"""
-    import asyncio
-
+    """Run selected scripts in order. With `concurrent`, they all run at once instead -
+    total time is the slowest script, not the sum."""
     if not state.project_folder:
         raise HTTPException(status_code=400, detail="No project folder selected")
 
-    results: list[ScriptResultResponse] = []
+    # Run as asyncio subprocesses so server stays responsive (allows stop requests)
+    if request.concurrent:
+        script_results = await asyncio.gather(*(
+            run_script_async(Path(script_path), state.project_folder)
+            for script_path in request.scripts
+        ))
+    else:
+        # Scripts often chain through output_folder - each one may read what the previous wrote
+        script_results = []
+        for script_path in request.scripts:
+            script_results.append(await run_script_async(Path(script_path), state.project_folder))
 
-    for script_path in request.scripts:
-        # Run in thread pool so server stays responsive (allows stop requests)
-        result = await asyncio.to_thread(run_script, Path(script_path), state.project_folder)
+    results: list[ScriptResultResponse] = []
+    for result in script_results:
         results.append(ScriptResultResponse(
             script_path=result.script_path,
             success=result.success,
@@ -590,6 +1008,58 @@ async def create_directory(request: MkdirRequest):
         raise HTTPException(status_code=500, detail=f"Failed to create folder: {str(e)}")
 
 
+# Candidate CSV separators, in tie-break order
+CSV_SEPARATORS = (b',', b'\t', b';', b'|')
+
+
+def detect_csv_separator(sample: bytes, max_lines: int = 20) -> str:
+    """Detect a CSV separator from a raw byte sample.
+    Prefers a separator that appears the same non-zero number of times on every sampled line,
+    then the most frequent one. Works on bytes directly (bytes.count is a C memchr loop),
+    so the sample never needs decoding."""
+    lines = sample.splitlines()
+    if len(lines) > 1 and not sample.endswith((b'\n', b'\r')):
+        lines = lines[:-1]  # Drop the partial trailing line
+    lines = [line for line in lines[:max_lines] if line]
+    if not lines:
+        return ','
+
+    best, best_rank = ',', (False, 0)
+    for sep in CSV_SEPARATORS:
+        counts = [line.count(sep) for line in lines]
+        total = sum(counts)
+        if not total:
+            continue
+        rank = (all(c == counts[0] for c in counts), total)
+        if rank > best_rank:
+            best, best_rank = sep.decode(), rank
+    return best
+
+
+def geoparquet_geometry_columns(metadata) -> frozenset:
+    """Geometry column names declared in a Parquet footer's "geo" key (empty for plain Parquet).
+    Read from the already-parsed footer, so detecting GeoParquet costs no extra I/O."""
+    geo = (metadata.metadata or {}).get(b"geo")
+    if not geo:
+        return frozenset()
+    try:
+        return frozenset(orjson.loads(geo).get("columns", {}))
+    except (orjson.JSONDecodeError, AttributeError):
+        return frozenset()
+
+
+# Old Mac CR-only line endings are rewritten to LF through this table, a block at a time
+_CR_TO_LF = bytes.maketrans(b'\r', b'\n')
+CSV_SNIFF_SIZE = 64 * 1024
+CSV_REWRITE_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+def has_cr_only_line_endings(sample: bytes) -> bool:
+    """True if the sample uses old Mac line endings - CRs and no LF anywhere.
+    A lone CR in a CRLF/LF file is cell data (e.g. inside a quoted field) and must be left alone."""
+    return b'\r' in sample and b'\n' not in sample
+
+
 # Extensions forbidden in app_folder (raw data files)
 FORBIDDEN_APP_FOLDER_EXTENSIONS = {
     '.csv', '.xlsx', '.xls', '.xlsm', '.xlsb',  # Spreadsheets
@@ -601,8 +1071,20 @@ FORBIDDEN_APP_FOLDER_EXTENSIONS = {
 }
 
 
-def build_file_tree(path: Path, base_path: Path, deleted_files: list = None, in_app_folder: bool = False) -> dict:
-    """Build a file tree recursively, auto-deleting forbidden files in app_folder"""
+# Subdirectories this deep are walked in parallel (deeper levels stay serial within each worker)
+TREE_PARALLEL_DEPTH = 2
+TREE_MAX_WORKERS = 16
+
+
+def build_file_tree(
+    path: Path,
+    base_path: Path,
+    deleted_files: list = None,
+    in_app_folder: bool = False,
+    executor: Optional[Executor] = None
+) -> dict:
+    """Build a file tree recursively, auto-deleting forbidden files in app_folder.
+    With an executor, the top TREE_PARALLEL_DEPTH levels of subdirectories are scanned concurrently."""
     if deleted_files is None:
         deleted_files = []
 
@@ -617,35 +1099,79 @@ def build_file_tree(path: Path, base_path: Path, deleted_files: list = None, in_
     }
 
     if path.is_dir():
-        children = []
         # Check if we're entering app_folder
         entering_app_folder = in_app_folder or path.name == "app_folder"
-        try:
-            for item in sorted(path.iterdir()):
-                # Skip hidden files
-                if item.name.startswith('.'):
-                    continue
-
-                # Auto-delete forbidden files in app_folder
-                if entering_app_folder and item.is_file():
-                    ext = item.suffix.lower()
-                    if ext in FORBIDDEN_APP_FOLDER_EXTENSIONS:
-                        try:
-                            item.unlink()
-                            deleted_files.append(item.name)
-                            print(f"[Safety] Auto-deleted forbidden file: {item.name}")
-                        except Exception as e:
-                            print(f"[Safety] Failed to delete {item.name}: {e}")
-                        continue  # Don't add to tree
-
-                children.append(build_file_tree(item, base_path, deleted_files, entering_app_folder))
-        except PermissionError:
-            pass
-        node["children"] = children
+        node["children"] = _build_tree_children(
+            str(path), rel_path if rel_path != "." else "", deleted_files, entering_app_folder,
+            executor, TREE_PARALLEL_DEPTH if executor else 0
+        )
 
     return node
 
 
+def _build_tree_children(
+    dir_path: str,
+    rel_dir: str,
+    deleted_files: list,
+    in_app_folder: bool,
+    executor: Optional[Executor] = None,
+    parallel_depth: int = 0
+) -> list:
+    """Build the child nodes of a directory from a single os.scandir pass.
+    DirEntry caches file type (and stat on Windows), so each child costs at most one stat.
+
+    While parallel_depth > 0 this walks in the calling thread; subdirectories at the last
+    parallel level are submitted to the executor as independent serial walks. Submissions only
+    happen from the calling thread, so workers never block waiting on each other."""
+    children = []
+    pending = []  # (node, future) pairs resolved after the scan, preserving sort order
+    try:
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except PermissionError:
+        return children
+
+    for entry in entries:
+        name = entry.name
+        # Skip hidden files
+        if name.startswith('.'):
+            continue
+
+        is_file = entry.is_file()
+        ext = os.path.splitext(name)[1]
+
+        # Auto-delete forbidden files in app_folder
+        if in_app_folder and is_file and ext.lower() in FORBIDDEN_APP_FOLDER_EXTENSIONS:
+            try:
+                os.unlink(entry.path)
+                deleted_files.append(name)
+                print(f"[Safety] Auto-deleted forbidden file: {name}")
+            except Exception as e:
+                print(f"[Safety] Failed to delete {name}: {e}")
+            continue  # Don't add to tree
+
+        rel_path = f"{rel_dir}{os.sep}{name}" if rel_dir else name
+        node = {
+            "name": name,
+            "path": rel_path,
+            "isDirectory": not is_file,
+            "extension": ext if is_file else None,
+            "lastModified": entry.stat().st_mtime if is_file else None,
+        }
+        if entry.is_dir():
+            child_args = (entry.path, rel_path, deleted_files, in_app_folder or name == "app_folder")
+            if parallel_depth == 1:
+                pending.append((node, executor.submit(_build_tree_children, *child_args)))
+            else:
+                node["children"] = _build_tree_children(*child_args, executor, max(parallel_depth - 1, 0))
+        children.append(node)
+
+    for node, future in pending:
+        node["children"] = future.result()
+
+    return children
+
+
 @app.get("/api/files/tree")
 async def get_file_tree():
     """Get the complete file tree for the project"""
@@ -653,7 +1179,11 @@ async def get_file_tree():
         raise HTTPException(status_code=400, detail="No project folder selected")
 
     deleted_files = []
-    tree = build_file_tree(state.project_folder, state.project_folder, deleted_files)
+    # Scan off the event loop; subdirectory scandir calls overlap in the pool
+    with ThreadPoolExecutor(max_workers=TREE_MAX_WORKERS) as executor:
+        tree = await asyncio.to_thread(
+            build_file_tree, state.project_folder, state.project_folder, deleted_files, executor=executor
+        )
     return {"tree": tree, "deletedFiles": deleted_files}
 
 
@@ -677,64 +1207,47 @@ async def read_file(path: str):
         raise HTTPException(status_code=400, detail="Path is not a file")
 
     # Security check - ensure path is within project folder
-    try:
-        file_path.resolve().relative_to(state.project_folder.resolve())
-    except ValueError:
-        raise HTTPException(status_code=403, detail="Access denied")
+    check_in_project(file_path)
 
     # Determine file type and read accordingly
     ext = file_path.suffix.lower()
     binary_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp', '.pdf', '.zip', '.tar', '.gz'}
-    dataframe_extensions = {'.csv', '.xlsx', '.xls'}
+    dataframe_extensions = {'.csv', '.xlsx', '.xls', '.parquet', '.geoparquet'}
 
     if ext in dataframe_extensions:
         print(f"[File Read] Parsing dataframe: {path}")
         # Parse as dataframe using Polars (much faster than pandas)
         try:
+            skip_columns = frozenset()
             if ext == '.csv':
                 # Read raw bytes to detect line endings and separator
                 with open(file_path, 'rb') as f:
-                    sample = f.read(4096)
-
-                # Detect line ending style
-                has_crlf = b'\r\n' in sample
-                has_lf = b'\n' in sample
-                has_cr = b'\r' in sample
-
-                # Detect separator from first line
-                if has_crlf:
-                    first_line = sample.split(b'\r\n')[0].decode('utf-8', errors='ignore')
-                elif has_lf:
-                    first_line = sample.split(b'\n')[0].decode('utf-8', errors='ignore')
-                elif has_cr:
-                    first_line = sample.split(b'\r')[0].decode('utf-8', errors='ignore')
-                else:
-                    first_line = sample.decode('utf-8', errors='ignore')
+                    sample = f.read(CSV_SNIFF_SIZE)
 
                 # Detect separator
-                if '\t' in first_line:
-                    separator = '\t'
-                elif ';' in first_line:
-                    separator = ';'
-                else:
-                    separator = ','
+                separator = detect_csv_separator(sample[:4096])
 
-                # Handle old Mac CR-only line endings - need temp file for streaming
-                needs_cr_conversion = has_cr and not has_lf and not has_crlf
+                # Polars reads LF and CRLF natively - only CR-only (old Mac) files need a rewrite
                 actual_file_path = file_path
                 temp_file = None
 
-                if needs_cr_conversion:
-                    # Convert CR to LF and write to temp file for streaming
+                if has_cr_only_line_endings(sample):
+                    # Normalize to LF into a temp file block by block - never holds the whole file
                     import tempfile
-                    with open(file_path, 'rb') as f:
-                        content = f.read()
-                    content = content.replace(b'\r', b'\n')
-                    temp_file = tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False)
-                    temp_file.write(content)
-                    temp_file.close()
+                    temp_file = tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False, buffering=1 << 20)
+                    with open(file_path, 'rb') as src, temp_file:
+                        carry = b''
+                        while chunk := src.read(CSV_REWRITE_CHUNK_SIZE):
+                            chunk = carry + chunk
+                            # Hold back a trailing CR in case its LF starts the next block
+                            carry = b'\r' if chunk.endswith(b'\r') else b''
+                            if carry:
+                                chunk = chunk[:-1]
+                            if b'\r\n' in chunk:
+                                chunk = chunk.replace(b'\r\n', b'\n')
+                            temp_file.write(chunk.translate(_CR_TO_LF))
+                        temp_file.write(carry.translate(_CR_TO_LF))
                     actual_file_path = Path(temp_file.name)
-                    del content  # Free memory
 
                 # Store CSV file info for streaming
                 df_state.clear()
@@ -743,11 +1256,31 @@ async def read_file(path: str):
                 df_state.file_type = 'csv'
 
                 # Get schema and row count efficiently using streaming
-                lf = pl.scan_csv(actual_file_path, separator=separator, infer_schema_length=10000)
-                df_state.columns = lf.collect_schema().names()
-                schema = lf.collect_schema()
+                # (goes through the state's cache so paginate reuses the inferred schema)
+                lf = df_state._get_lazy_frame()
+                schema = df_state.schema
+                df_state.columns = schema.names()
                 # Count rows (streams through file but doesn't hold in memory)
-                df_state.total_rows = lf.select(pl.len()).collect().item()
+                df_state.total_rows = lf.select(pl.len()).collect(engine="streaming").item()
+
+            elif ext in ('.parquet', '.geoparquet'):
+                # Parquet - schema and row count come from the file footer
+                df_state.clear()
+                df_state.file_path = str(file_path)
+                df_state.file_type = 'parquet'
+                if PYARROW_AVAILABLE:
+                    # Footer metadata only - O(1) regardless of file size, no Polars plan
+                    with pq.ParquetFile(file_path) as pf:
+                        df_state.cache_parquet_metadata(pf.metadata)
+                        # GeoParquet geometry is WKB - not filterable, and scanning it for stats is wasted work
+                        skip_columns = geoparquet_geometry_columns(pf.metadata)
+                        schema = pl.from_arrow(pf.schema_arrow.empty_table()).schema
+                        df_state.total_rows = pf.metadata.num_rows
+                else:
+                    lf = df_state._get_lazy_frame()
+                    schema = df_state.schema
+                    df_state.total_rows = lf.select(pl.len()).collect(engine="streaming").item()
+                df_state.columns = schema.names()
 
             else:
                 # Excel - need to read (but usually smaller files)
@@ -755,45 +1288,34 @@ async def read_file(path: str):
                 df_state.file_path = str(file_path)
                 df_state.file_type = 'excel'
                 df_state.csv_separator = ','
-                # Just get schema info, don't hold the data
+                # Parse the workbook once and reuse the same frame for paging
                 temp_df = pl.read_excel(file_path)
                 df_state.columns = temp_df.columns
                 schema = temp_df.schema
                 df_state.total_rows = len(temp_df)
+                df_state.cache_lazy_frame(temp_df.lazy(), schema)
                 del temp_df
-                lf = pl.read_excel(file_path).lazy()
 
             # Just store schema types - defer detailed column info until user filters
             # This avoids scanning the entire file multiple times on load
-            column_info = {}
-            for col in df_state.columns:
-                dtype = schema.get(col)
-                if dtype is None:
-                    continue
-                if dtype.is_numeric():
-                    column_info[col] = {"type": "numeric", "min": 0, "max": 0}
-                else:
-                    column_info[col] = {"type": "categorical", "values": []}
-
-            df_state.column_info = column_info
+            df_state.column_info = df_state.classify_columns(schema, skip_columns)
 
             # Get first chunk using streaming
             CHUNK_SIZE = 200
             first_chunk, total_rows = df_state.get_rows(0, CHUNK_SIZE)
 
-            print(f"[File Read] Streaming mode: {df_state.total_rows} rows, only loaded {len(first_chunk)}")
+            print(f"[File Read] Streaming mode: {df_state.total_rows} rows, only loaded {first_chunk.height}")
 
-            return {
+            return rows_json_response({
                 "type": "dataframe",
                 "filePath": path,
                 "columns": df_state.columns,
-                "columnInfo": column_info,
-                "data": first_chunk,
+                "columnInfo": df_state.column_info,
                 "totalRows": df_state.total_rows,
                 "offset": 0,
                 "limit": CHUNK_SIZE,
                 "filename": file_path.name
-            }
+            }, first_chunk)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to parse file: {str(e)}")
 
@@ -802,18 +1324,20 @@ async def read_file(path: str):
         image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp'}
         if ext in image_extensions:
             return {"type": "image", "path": path, "filename": file_path.name, "extension": ext}
-        # Other binary files - still use base64
-        import base64
-        content = base64.b64encode(file_path.read_bytes()).decode('utf-8')
-        return {"content": content, "encoding": "base64", "filename": file_path.name}
+        # Other binary files - still use base64, streamed
+        return base64_json_response(file_path)
     else:
+        # Peek first - a zip/OLE document (.docx, .doc, ...) would otherwise be read and
+        # decoded in full only to fail with UnicodeDecodeError
+        with open(file_path, 'rb') as f:
+            head = f.read(BINARY_SNIFF_SIZE)
+        if is_binary_head(head):
+            return base64_json_response(file_path)
         try:
             content = file_path.read_text(encoding='utf-8')
             return {"content": content, "encoding": "utf-8", "filename": file_path.name}
         except UnicodeDecodeError:
-            import base64
-            content = base64.b64encode(file_path.read_bytes()).decode('utf-8')
-            return {"content": content, "encoding": "base64", "filename": file_path.name}
+            return base64_json_response(file_path)
 
 
 @app.get("/api/image")
@@ -822,13 +1346,8 @@ async def get_image(path: str):
     if not state.project_folder:
         raise HTTPException(status_code=400, detail="No project folder selected")
 
-    file_path = state.project_folder / path
-
-    # Security check
-    try:
-        file_path.resolve().relative_to(state.project_folder.resolve())
-    except ValueError:
-        raise HTTPException(status_code=403, detail="Access denied")
+    # Security check - ensure path is within project folder
+    file_path = _safe_join(path)
 
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="Image not found")
@@ -861,13 +1380,8 @@ async def write_file(request: WriteFileRequest):
     if not state.project_folder:
         raise HTTPException(status_code=400, detail="No project folder selected")
 
-    file_path = state.project_folder / request.path
-
     # Security check - ensure path is within project folder
-    try:
-        file_path.resolve().relative_to(state.project_folder.resolve())
-    except ValueError:
-        raise HTTPException(status_code=403, detail="Access denied")
+    file_path = _safe_join(request.path)
 
     # Create parent directories if needed
     file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -877,6 +1391,9 @@ async def write_file(request: WriteFileRequest):
     return {"success": True, "path": request.path}
 
 
+UPLOAD_COPY_BUFSIZE = 1024 * 1024
+
+
 @app.post("/api/files/upload")
 async def upload_file(
     file: UploadFile = File(...),
@@ -891,17 +1408,18 @@ async def upload_file(
     target_path = target_folder / file.filename
 
     # Security check - ensure path is within project folder
-    try:
-        target_path.resolve().relative_to(state.project_folder.resolve())
-    except ValueError:
-        raise HTTPException(status_code=403, detail="Access denied")
+    check_in_project(target_path)
 
     # Create parent directories if needed
     target_folder.mkdir(parents=True, exist_ok=True)
 
-    # Write file content
-    content = await file.read()
-    target_path.write_bytes(content)
+    # Copy the spooled upload to disk in 1MB blocks, off the event loop
+    def write_upload():
+        import shutil
+        with open(target_path, 'wb') as out:
+            shutil.copyfileobj(file.file, out, UPLOAD_COPY_BUFSIZE)
+
+    await asyncio.to_thread(write_upload)
 
     return {"success": True, "path": f"{folder}/{file.filename}"}
 
@@ -917,13 +1435,8 @@ async def delete_file(request: DeleteFileRequest):
     if not state.project_folder:
         raise HTTPException(status_code=400, detail="No project folder selected")
 
-    file_path = state.project_folder / request.path
-
     # Security check - ensure path is within project folder
-    try:
-        file_path.resolve().relative_to(state.project_folder.resolve())
-    except ValueError:
-        raise HTTPException(status_code=403, detail="Access denied")
+    file_path = _safe_join(request.path)
 
     if not file_path.exists():
         raise HTTPException(status_code=404, detail="File not found")
@@ -952,11 +1465,8 @@ async def rename_file(request: RenameRequest):
     if not old_path.is_absolute():
         old_path = state.project_folder / request.oldPath
 
-    # Security check
-    try:
-        old_path.resolve().relative_to(state.project_folder.resolve())
-    except ValueError:
-        raise HTTPException(status_code=403, detail="Access denied")
+    # Security check - ensure path is within project folder
+    check_in_project(old_path)
 
     if not old_path.exists():
         raise HTTPException(status_code=404, detail="File not found")
@@ -993,11 +1503,8 @@ async def move_file(request: MoveRequest):
         dest_path = state.project_folder / request.destPath
 
     # Security check
-    try:
-        source_path.resolve().relative_to(state.project_folder.resolve())
-        dest_path.resolve().relative_to(state.project_folder.resolve())
-    except ValueError:
-        raise HTTPException(status_code=403, detail="Access denied")
+    check_in_project(source_path)
+    check_in_project(dest_path)
 
     if not source_path.exists():
         raise HTTPException(status_code=404, detail="Source file not found")
@@ -1017,30 +1524,45 @@ class DataFrameQueryRequest(BaseModel):
     filePath: str
     filters: dict = {}
     sort: Optional[dict] = None  # {column: str, direction: "asc"|"desc"}
+    layout: str = "rows"  # "rows" or "columns" (column-major data)
+    columns: Optional[list[str]] = None  # Only compute columnInfo for these (default: all columns)
 
 
-@app.get("/api/dataframe/rows")
+@app.get("/api/dataframe/rows", response_class=ORJSONResponse)
 async def get_dataframe_rows(
     filePath: str,
     offset: int = 0,
-    limit: int = 200
+    limit: int = 200,
+    columns: Optional[list[str]] = Query(None),
+    layout: str = "rows",
+    accept: Optional[str] = Header(None)
 ):
-    """Get paginated rows - streams from disk, doesn't hold full file in memory"""
+    """Get paginated rows - streams from disk, doesn't hold full file in memory.
+    Pass `columns` to only read the visible subset of a wide table, and `layout=columns`
+    for column-major data ({col: [values...]}).
+    Send `Accept: application/vnd.apache.arrow.stream` to get the page as Arrow IPC
+    (offset/limit/total go in X-Offset/X-Limit/X-Total-Rows headers) instead of JSON."""
     if df_state.file_path is None:
         raise HTTPException(status_code=400, detail="No DataFrame loaded. Read a file first.")
 
     # Stream rows from disk
-    rows, total_rows = df_state.get_rows(offset, limit)
+    rows_df, total_rows = df_state.get_rows(offset, limit, columns)
 
-    return {
-        "data": rows,
+    if accept and ARROW_STREAM_MEDIA_TYPE in accept:
+        return rows_arrow_response(rows_df, {
+            "X-Offset": str(offset),
+            "X-Limit": str(limit),
+            "X-Total-Rows": str(total_rows)
+        })
+
+    return rows_json_response({
         "offset": offset,
         "limit": limit,
         "totalRows": total_rows
-    }
+    }, rows_df, layout)
 
 
-@app.post("/api/dataframe/query")
+@app.post("/api/dataframe/query", response_class=ORJSONResponse)
 async def query_dataframe(request: DataFrameQueryRequest):
     """Apply filters and/or sort to the DataFrame - streams from disk"""
     if df_state.file_path is None or df_state.file_path != request.filePath:
@@ -1049,30 +1571,46 @@ async def query_dataframe(request: DataFrameQueryRequest):
     # Update filters and sort on state
     df_state.current_filters = request.filters
     df_state.current_sort = request.sort
-    df_state.invalidate_filter_cache()  # Force recount
 
-    # Get first chunk using streaming
+    # First chunk, filtered count and cascading columnInfo together
     CHUNK_SIZE = 200
-    rows, total_rows = df_state.get_rows(0, CHUNK_SIZE)
-
-    # Compute cascading columnInfo from filtered data
-    # For efficiency, we sample a limited number of rows for column stats
-    cascading_column_info = await _compute_cascading_column_info()
+    target_cols, footer_bounds, exprs = _column_info_plan(request.columns)
+    try:
+        rows_df, total_rows, stats = df_state.get_first_page_with_stats(CHUNK_SIZE, exprs)
+        row = stats.row(0, named=True) if stats is not None else {}
+        cascading_column_info = _column_info_from_row(target_cols, footer_bounds, row)
+    except Exception:
+        # A stats expression the data can't satisfy shouldn't fail the page - compute separately
+        rows_df, total_rows = df_state.get_rows(0, CHUNK_SIZE)
+        cascading_column_info = await _compute_cascading_column_info(request.columns)
 
-    return {
-        "data": rows,
+    return rows_json_response({
         "totalRows": total_rows,
         "offset": 0,
         "limit": CHUNK_SIZE,
         "appliedFilters": request.filters,
         "appliedSort": request.sort,
         "columnInfo": cascading_column_info
-    }
+    }, rows_df, request.layout)
+
+
+@app.get("/api/dataframe/column-info", response_class=ORJSONResponse)
+async def get_dataframe_column_info(column: str):
+    """Compute filter stats for a single column on demand (when its filter panel opens)"""
+    if df_state.file_path is None:
+        raise HTTPException(status_code=400, detail="No DataFrame loaded. Read a file first.")
 
+    if column not in df_state.columns:
+        raise HTTPException(status_code=404, detail=f"Column not found: {column}")
 
-async def _compute_cascading_column_info() -> dict:
+    column_info = await _compute_cascading_column_info([column])
+    # Returned as a response so FastAPI skips the jsonable_encoder walk over up to 500 values
+    return ORJSONResponse({"column": column, "columnInfo": column_info.get(column)})
+
+
+async def _compute_cascading_column_info(columns: Optional[list[str]] = None) -> dict:
     """Compute column info (min/max for numeric, unique values for categorical) from filtered data.
-    Uses lazy evaluation for efficiency."""
+    Uses lazy evaluation for efficiency. Limit to `columns` to avoid scanning every column."""
     if df_state.file_path is None:
         return {}
 
@@ -1080,45 +1618,86 @@ async def _compute_cascading_column_info() -> dict:
     if lf is None:
         return {}
 
-    lf = df_state._apply_filters_sort(lf)
+    # Stats don't depend on row order, so the sort is left out of this plan
+    lf = df_state._apply_filters(lf)
 
-    # Collect schema to determine column types
-    schema = lf.collect_schema()
-    cascading_column_info = {}
-
-    for col in df_state.columns:
-        dtype = schema.get(col)
-        if dtype is None:
-            continue
+    target_cols, footer_bounds, exprs = _column_info_plan(columns)
+    if not exprs and not footer_bounds:
+        return {}
 
+    row = {}
+    failed_cols = []
+    if exprs:
         try:
-            if dtype.is_numeric():
-                # Get min/max in one query
-                stats = lf.select([
-                    pl.col(col).min().alias('min'),
-                    pl.col(col).max().alias('max')
-                ]).collect()
-                min_val = stats['min'][0]
-                max_val = stats['max'][0]
-                cascading_column_info[col] = {
-                    "type": "numeric",
-                    "min": float(min_val) if min_val is not None else 0,
-                    "max": float(max_val) if max_val is not None else 0
-                }
-            else:
-                # Categorical - get unique values (limit to 500)
-                unique_vals = lf.select(
-                    pl.col(col).drop_nulls().unique().head(500)
-                ).collect()[col].to_list()
-                unique_vals = [str(v) for v in unique_vals if v != '']
-                cascading_column_info[col] = {
-                    "type": "categorical",
-                    "values": unique_vals
-                }
+            # Streamed - aggregates only need one morsel at a time
+            stats = lf.select(exprs).collect(engine="streaming")
+            # One plain dict for the single result row, instead of a Series lookup per field
+            row = stats.row(0, named=True)
         except Exception:
-            # If any error, use cached column info
-            if col in df_state.column_info:
-                cascading_column_info[col] = df_state.column_info[col]
+            # One bad column shouldn't blank the others - retry column by column
+            for col in target_cols:
+                if col in footer_bounds:
+                    continue
+                try:
+                    stats = lf.select(_column_stats_exprs(col)).collect(engine="streaming")
+                    row.update(stats.row(0, named=True))
+                except Exception:
+                    failed_cols.append(col)
+
+    column_info = _column_info_from_row([col for col in target_cols if col not in failed_cols], footer_bounds, row)
+    # If a column's query fails, use its cached column info
+    for col in failed_cols:
+        if col in df_state.column_info:
+            column_info[col] = df_state.column_info[col]
+    return column_info
+
+
+def _column_info_plan(columns: Optional[list[str]] = None) -> tuple[list[str], dict, list[pl.Expr]]:
+    """Columns to describe, footer-derived bounds, and the stats expressions still to compute"""
+    # Column types were classified when the file was opened
+    known_cols = df_state._numeric_cols | df_state._categorical_cols
+    target_cols = [col for col in columns or df_state.columns if col in known_cols]
+    # Unfiltered Parquet min/max can come straight from the cached footer statistics
+    footer_bounds = df_state.footer_min_max([col for col in target_cols if col in df_state._numeric_cols])
+
+    # Build every column's stats into one select so the file is scanned once, not once per column
+    exprs = []
+    for col in target_cols:
+        if col not in footer_bounds:
+            exprs.extend(_column_stats_exprs(col))
+    return target_cols, footer_bounds, exprs
+
+
+def _column_stats_exprs(col: str) -> list[pl.Expr]:
+    """Stats expressions for one column, aliased as <col>__min/__max or <col>__values"""
+    if col in df_state._numeric_cols:
+        return [pl.col(col).min().alias(f'{col}__min'), pl.col(col).max().alias(f'{col}__max')]
+    # Categorical - unique values (limit to 500), imploded into a single list cell
+    return [pl.col(col).drop_nulls().unique().head(500).implode().alias(f'{col}__values')]
+
+
+def _column_info_from_row(target_cols: list[str], footer_bounds: dict, row: dict) -> dict:
+    """Shape the stats row (plus any footer bounds) into the columnInfo payload"""
+    numeric_cols = df_state._numeric_cols
+    cascading_column_info = {}
+    for col in target_cols:
+        if col in numeric_cols:
+            if col in footer_bounds:
+                min_val, max_val = footer_bounds[col]
+            else:
+                min_val = row[f'{col}__min']
+                max_val = row[f'{col}__max']
+            cascading_column_info[col] = {
+                "type": "numeric",
+                "min": float(min_val) if min_val is not None else 0,
+                "max": float(max_val) if max_val is not None else 0
+            }
+        else:
+            unique_vals = [str(v) for v in row[f'{col}__values'] if v != '']
+            cascading_column_info[col] = {
+                "type": "categorical",
+                "values": unique_vals
+            }
 
     return cascading_column_info
 
@@ -1152,47 +1731,59 @@ async def sync_pull_scripts(request: SyncPullRequest):
     if not state.project_folder:
         raise HTTPException(status_code=400, detail="No project folder selected")
 
-    synced_files = []
     new_last_sync = dict(request.last_sync)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        # Get scripts list from codespace
-        try:
-            response = await client.get(f"{request.codespace_url}/scripts")
-            response.raise_for_status()
-            scripts = response.json().get("scripts", [])
-        except Exception as e:
-            raise HTTPException(status_code=502, detail=f"Failed to fetch scripts: {str(e)}")
+    client = get_http_client()
+    # Get scripts list from codespace
+    try:
+        response = await client.get(f"{request.codespace_url}/scripts")
+        response.raise_for_status()
+        scripts = response.json().get("scripts", [])
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Failed to fetch scripts: {str(e)}")
 
-        # Get or create local app_folder/scripts
-        app_folder = state.project_folder / "app_folder"
-        app_folder.mkdir(parents=True, exist_ok=True)
+    # Get or create local app_folder/scripts
+    app_folder = state.project_folder / "app_folder"
+    app_folder.mkdir(parents=True, exist_ok=True)
 
-        for script in scripts:
-            file_path = script.get("path") or script.get("name")
-            server_mod = int(script.get("modified", 0))
-            local_mod = int(request.last_sync.get(file_path, 0))
+    semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
 
-            # Download if new or modified
-            if local_mod < server_mod:
-                try:
-                    script_response = await client.get(
-                        f"{request.codespace_url}/scripts/{file_path}"
-                    )
-                    script_response.raise_for_status()
-                    script_data = script_response.json()
-
-                    # Write to local file
-                    local_path = app_folder / file_path
-                    local_path.parent.mkdir(parents=True, exist_ok=True)
-                    local_path.write_text(script_data.get("content", ""), encoding="utf-8")
-
-                    new_last_sync[file_path] = server_mod
-                    synced_files.append(file_path)
-                except Exception as e:
-                    print(f"Failed to sync {file_path}: {e}")
-            else:
-                new_last_sync[file_path] = local_mod
+    def write_script(local_path: Path, content: str):
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        local_path.write_text(content, encoding="utf-8")
+
+    async def fetch(file_path: str, server_mod: int) -> Optional[str]:
+        async with semaphore:
+            try:
+                script_response = await client.get(
+                    f"{request.codespace_url}/scripts/{file_path}"
+                )
+                script_response.raise_for_status()
+                script_data = script_response.json()
+
+                # Write to local file
+                await asyncio.to_thread(write_script, app_folder / file_path, script_data.get("content", ""))
+
+                new_last_sync[file_path] = server_mod
+                return file_path
+            except Exception as e:
+                print(f"Failed to sync {file_path}: {e}")
+                return None
+
+    downloads = []
+    for script in scripts:
+        file_path = script.get("path") or script.get("name")
+        server_mod = int(script.get("modified", 0))
+        local_mod = int(request.last_sync.get(file_path, 0))
+
+        # Download if new or modified
+        if local_mod < server_mod:
+            downloads.append(fetch(file_path, server_mod))
+        else:
+            new_last_sync[file_path] = local_mod
+
+    results = await asyncio.gather(*downloads)
+    synced_files = [path for path in results if path is not None]
 
     return {"synced_files": synced_files, "last_sync": new_last_sync}
 
@@ -1203,14 +1794,14 @@ async def sync_push_scripts(request: SyncPushRequest):
     if not state.project_folder:
         raise HTTPException(status_code=400, detail="No project folder selected")
 
-    pushed_files = []
     app_folder = state.project_folder / "app_folder"
 
     if not app_folder.exists():
         return {"pushed_files": []}
 
     def collect_files(folder: Path, prefix: str = "") -> list:
-        """Recursively collect files to push"""
+        """Recursively collect (local path, relative path) pairs to push.
+        Contents are read per file while pushing, so disk reads overlap the HTTP posts."""
         files = []
         try:
             for item in folder.iterdir():
@@ -1227,28 +1818,36 @@ async def sync_push_scripts(request: SyncPushRequest):
                     if ext in FORBIDDEN_SYNC_EXTENSIONS:
                         continue
                     rel_path = f"{prefix}/{item.name}" if prefix else item.name
-                    try:
-                        content = item.read_text(encoding="utf-8")
-                        files.append({"path": rel_path, "content": content})
-                    except Exception:
-                        pass
+                    files.append((item, rel_path))
         except PermissionError:
             pass
         return files
 
-    files_to_push = collect_files(app_folder)
+    files_to_push = await asyncio.to_thread(collect_files, app_folder)
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for file in files_to_push:
+    client = get_http_client()
+    # Push concurrently, but cap in-flight requests so the codespace isn't flooded
+    semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
+
+    async def push_one(item: Path, rel_path: str) -> Optional[str]:
+        async with semaphore:
+            try:
+                content = await asyncio.to_thread(item.read_text, encoding="utf-8")
+            except Exception:
+                return None  # Unreadable or not UTF-8 - skip silently, as before
             try:
                 response = await client.post(
-                    f"{request.codespace_url}/scripts/{file['path']}",
-                    json={"content": file["content"]}
+                    f"{request.codespace_url}/scripts/{rel_path}",
+                    json={"content": content}
                 )
                 response.raise_for_status()
-                pushed_files.append(file["path"])
+                return rel_path
             except Exception as e:
-                print(f"Failed to push {file['path']}: {e}")
+                print(f"Failed to push {rel_path}: {e}")
+                return None
+
+    results = await asyncio.gather(*(push_one(item, rel_path) for item, rel_path in files_to_push))
+    pushed_files = [path for path in results if path is not None]
 
     return {"pushed_files": pushed_files}
 
@@ -1275,19 +1874,19 @@ async def sync_metadata_to_codespace(request: SyncPushRequest):
     if not input_metadata and not output_metadata:
         return {"success": True, "synced": False}
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        try:
-            response = await client.post(
-                f"{request.codespace_url}/metadata",
-                json={
-                    "input_metadata": input_metadata,
-                    "output_metadata": output_metadata
-                }
-            )
-            response.raise_for_status()
-            return {"success": True, "synced": True}
-        except Exception as e:
-            raise HTTPException(status_code=502, detail=f"Failed to sync metadata: {str(e)}")
+    client = get_http_client()
+    try:
+        response = await client.post(
+            f"{request.codespace_url}/metadata",
+            json={
+                "input_metadata": input_metadata,
+                "output_metadata": output_metadata
+            }
+        )
+        response.raise_for_status()
+        return {"success": True, "synced": True}
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Failed to sync metadata: {str(e)}")
 
 
 @app.post("/api/sync/full")
@@ -1333,25 +1932,25 @@ class TokenPollRequest(BaseModel):
 async def github_device_code(request: DeviceCodeRequest):
     """Initiate GitHub device flow authentication"""
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://github.com/login/device/code",
-                data={
-                    "client_id": request.client_id,
-                    "scope": request.scope,
-                },
-                headers={"Accept": "application/json"},
-            )
-
-            if not response.content:
-                return JSONResponse(status_code=502, content={"error": "Empty response from GitHub"})
+        client = get_http_client()
+        response = await client.post(
+            "https://github.com/login/device/code",
+            data={
+                "client_id": request.client_id,
+                "scope": request.scope,
+            },
+            headers={"Accept": "application/json"},
+        )
 
-            try:
-                data = response.json()
-            except Exception:
-                return JSONResponse(status_code=502, content={"error": f"Invalid response from GitHub"})
+        if not response.content:
+            return JSONResponse(status_code=502, content={"error": "Empty response from GitHub"})
+
+        try:
+            data = response.json()
+        except Exception:
+            return JSONResponse(status_code=502, content={"error": f"Invalid response from GitHub"})
 
-            return JSONResponse(status_code=response.status_code, content=data)
+        return JSONResponse(status_code=response.status_code, content=data)
     except httpx.TimeoutException:
         return JSONResponse(status_code=504, content={"error": "GitHub request timed out"})
     except Exception as e:
@@ -1362,26 +1961,26 @@ async def github_device_code(request: DeviceCodeRequest):
 async def github_token(request: TokenPollRequest):
     """Poll for GitHub access token"""
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                "https://github.com/login/oauth/access_token",
-                data={
-                    "client_id": request.client_id,
-                    "device_code": request.device_code,
-                    "grant_type": request.grant_type,
-                },
-                headers={"Accept": "application/json"},
-            )
-
-            if not response.content:
-                return JSONResponse(status_code=502, content={"error": "Empty response from GitHub"})
+        client = get_http_client()
+        response = await client.post(
+            "https://github.com/login/oauth/access_token",
+            data={
+                "client_id": request.client_id,
+                "device_code": request.device_code,
+                "grant_type": request.grant_type,
+            },
+            headers={"Accept": "application/json"},
+        )
 
-            try:
-                data = response.json()
-            except Exception:
-                return JSONResponse(status_code=502, content={"error": "Invalid response from GitHub"})
+        if not response.content:
+            return JSONResponse(status_code=502, content={"error": "Empty response from GitHub"})
 
-            return JSONResponse(status_code=200, content=data)
+        try:
+            data = response.json()
+        except Exception:
+            return JSONResponse(status_code=502, content={"error": "Invalid response from GitHub"})
+
+        return JSONResponse(status_code=200, content=data)
     except httpx.TimeoutException:
         return JSONResponse(status_code=504, content={"error": "GitHub request timed out"})
     except Exception as e:
@@ -1406,7 +2005,7 @@ async def websocket_watch(websocket: WebSocket):
                     await websocket.send_text("pong")
             except asyncio.TimeoutError:
                 # Send keepalive
-                await websocket.send_text('{"type": "keepalive"}')
+                await websocket.send_text(KEEPALIVE_FRAME)
     except WebSocketDisconnect:
         state.websocket_clients.remove(websocket)
     except Exception:
@@ -1414,22 +2013,40 @@ async def websocket_watch(websocket: WebSocket):
             state.websocket_clients.remove(websocket)
 
 
+# Notification frames are fixed envelopes - only the JSON-escaped path (and change type) vary
+DATA_CHANGE_FRAME = '{"type": "data_change"}'
+KEEPALIVE_FRAME = '{"type": "keepalive"}'
+PONG_FRAME = '{"type":"pong"}'
+_SCRIPT_FRAME_PRE = '{"type":"script_change","path":'
+_OUTPUT_FRAME_PRE = '{"type":"output_file_change","path":'
+
+
+def _json_str(value: str) -> str:
+    """A string as a quoted, escaped JSON literal"""
+    return orjson.dumps(value).decode()
+
+
+async def broadcast(message: str):
+    """Send one message to every WebSocket client concurrently, so a slow client
+    doesn't hold up the rest. Clients whose send fails are dropped."""
+    clients = list(state.websocket_clients)
+    if not clients:
+        return
+    results = await asyncio.gather(
+        *(client.send_text(message) for client in clients),
+        return_exceptions=True
+    )
+    for client, result in zip(clients, results):
+        if isinstance(result, Exception) and client in state.websocket_clients:
+            state.websocket_clients.remove(client)
+
+
 async def notify_data_change():
     """Notify all WebSocket clients of data change"""
     if state.project_folder:
         generate_metadata(state.project_folder)
 
-    message = '{"type": "data_change"}'
-    disconnected = []
-
-    for client in state.websocket_clients:
-        try:
-            await client.send_text(message)
-        except Exception:
-            disconnected.append(client)
-
-    for client in disconnected:
-        state.websocket_clients.remove(client)
+    await broadcast(DATA_CHANGE_FRAME)
 
 
 async def notify_script_change(script_path: Path):
@@ -1448,21 +2065,13 @@ async def notify_script_change(script_path: Path):
             print(f"[Script Change] Debounced (duplicate within 3s): {full_path}")
             return
     state.last_script_change[debounce_key] = now
-    # Clean up old entries
-    state.last_script_change = {k: v for k, v in state.last_script_change.items() if now - v < 10.0}
+    state.last_script_change.move_to_end(debounce_key)
+    # Clean up old entries - only the expired head, not a full rebuild
+    while state.last_script_change and now - next(iter(state.last_script_change.values())) >= 10.0:
+        state.last_script_change.popitem(last=False)
 
     print(f"[Script Change] Notifying {len(state.websocket_clients)} clients: {full_path}")
-    message = json.dumps({"type": "script_change", "path": full_path})
-    disconnected = []
-
-    for client in state.websocket_clients:
-        try:
-            await client.send_text(message)
-        except Exception:
-            disconnected.append(client)
-
-    for client in disconnected:
-        state.websocket_clients.remove(client)
+    await broadcast(_SCRIPT_FRAME_PRE + _json_str(full_path) + '}')
 
 
 async def notify_output_file_change(file_path: Path, change_type: str):
@@ -1478,20 +2087,39 @@ async def notify_output_file_change(file_path: Path, change_type: str):
     rel_path = rel_path.replace("\\", "/")
 
     print(f"[Output Change] Notifying {len(state.websocket_clients)} clients: {rel_path}")
-    message = json.dumps({"type": "output_file_change", "path": rel_path, "change_type": change_type})
-    disconnected = []
+    await broadcast(_OUTPUT_FRAME_PRE + _json_str(rel_path) + ',"change_type":' + _json_str(change_type) + '}')
 
-    for client in state.websocket_clients:
-        try:
-            await client.send_text(message)
-        except Exception:
-            disconnected.append(client)
 
-    for client in disconnected:
-        state.websocket_clients.remove(client)
+# Local Terminal WebSocket
 
+# Per-session lifecycle messages are debug-level: reconnect storms shouldn't contend on stdout
+terminal_logger = logging.getLogger("vibefoundry.terminal")
+
+# Read up to 64KB per PTY read - amortizes syscalls during output floods
+PTY_READ_SIZE = 65536
+# PTY output is drained and coalesced into one WebSocket frame, up to this many bytes
+PTY_BATCH_SIZE = 256 * 1024
+
+
+# The two control messages the terminal client sends, as JSON.stringify writes them
+_PING_COMMAND = '{"type":"ping"}'
+_RESIZE_RE = re.compile(r'\{"type":"resize","(rows|cols)":(\d+),"(rows|cols)":(\d+)\}')
+
+
+def parse_terminal_command(data: str) -> Optional[dict]:
+    """Parse a terminal control message. The known compact shapes are matched directly;
+    anything else goes through json.loads. Returns None if it isn't a JSON object."""
+    if data == _PING_COMMAND:
+        return {"type": "ping"}
+    m = _RESIZE_RE.fullmatch(data)
+    if m:
+        return {"type": "resize", m[1]: int(m[2]), m[3]: int(m[4])}
+    try:
+        command = json.loads(data)
+    except json.JSONDecodeError:
+        return None
+    return command if isinstance(command, dict) else None
 
-# Local Terminal WebSocket
 
 def set_terminal_size(fd, rows, cols):
     """Set terminal window size"""
@@ -1501,6 +2129,46 @@ def set_terminal_size(fd, rows, cols):
     fcntl.ioctl(fd, termios.TIOCSWINSZ, winsize)
 
 
+async def write_pty(fd, data):
+    """Write all of data to the non-blocking PTY fd, waiting for room whenever its input buffer is full"""
+    view = memoryview(data)
+    while view:
+        try:
+            written = os.write(fd, view)
+        except BlockingIOError:
+            loop = asyncio.get_running_loop()
+            writable = loop.create_future()
+            loop.add_writer(fd, lambda: writable.done() or writable.set_result(None))
+            try:
+                await writable
+            finally:
+                loop.remove_writer(fd)
+            continue
+        view = view[written:]
+
+
+def open_pidfd(pid) -> Optional[int]:
+    """Open a pidfd for pid - it becomes readable when the process exits.
+    Returns None where pidfds aren't supported (non-Linux, or kernels before 5.3)."""
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def kill_process_group(pid, sig):
+    """Signal the process group led by pid, or just pid if the group is gone"""
+    try:
+        os.killpg(pid, sig)
+    except OSError:
+        try:
+            os.kill(pid, sig)
+        except OSError:
+            pass
+
+
 @app.websocket("/ws/terminal")
 async def websocket_terminal(websocket: WebSocket):
     """WebSocket for local terminal"""
@@ -1516,105 +2184,190 @@ async def websocket_terminal(websocket: WebSocket):
     pid, fd = pty.fork()
 
     if pid == 0:
-        # Child process - create new session/process group so we can kill all children
-        os.setsid()
+        # Child process - needs its own session/process group so we can kill all children.
+        # pty.fork() normally did setsid already, in which case this raises EPERM.
+        try:
+            os.setsid()
+        except OSError:
+            pass
         cwd = str(state.project_folder) if state.project_folder else str(Path.home())
         os.chdir(cwd)
         os.environ["TERM"] = "xterm-256color"
         os.execvp("bash", ["bash", "-l"])
     else:
         # Parent process - relay data
-        print(f"[Terminal] Started PTY process {pid}")
+        terminal_logger.debug("Started PTY process %s", pid)
         set_terminal_size(fd, 24, 80)
 
         # Make fd non-blocking
-        flags = fcntl.fcntl(fd, fcntl.F_GETFL)
-        fcntl.fcntl(fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+        os.set_blocking(fd, False)
+
+        loop = asyncio.get_running_loop()
+        # Set by the event loop once the shell exits, where pidfds are available
+        exited = asyncio.Event()
+        pidfd = open_pidfd(pid)
+        if pidfd is not None:
+            def on_shell_exit():
+                # A pidfd stays readable once the process exits - unregister so it fires only once
+                loop.remove_reader(pidfd)
+                exited.set()
+
+            loop.add_reader(pidfd, on_shell_exit)
+        # PTY output is pushed here by the event loop's reader callback; b'' marks EOF
+        pty_queue: asyncio.Queue = asyncio.Queue()
+
+        def on_pty_readable():
+            # Drain everything the PTY has buffered (fd is non-blocking) into one chunk
+            buf = bytearray()
+            eof = False
+            while len(buf) < PTY_BATCH_SIZE:
+                try:
+                    chunk = os.read(fd, PTY_READ_SIZE)
+                except BlockingIOError:
+                    break
+                except OSError:
+                    chunk = b''  # EIO once the shell has exited
+                if not chunk:
+                    eof = True
+                    break
+                buf += chunk
+            if buf:
+                pty_queue.put_nowait(bytes(buf))
+            if eof:
+                loop.remove_reader(fd)
+                pty_queue.put_nowait(b'')
+
+        loop.add_reader(fd, on_pty_readable)
+        # Both directions wait concurrently - whichever side has data is served immediately.
+        # Terminal bytes travel as binary frames (no decode/encode); text frames carry JSON control
+        # messages, or typed input from clients that still send text.
+        ws_task = asyncio.create_task(websocket.receive())
+        pty_task = asyncio.create_task(pty_queue.get())
 
         try:
             while True:
-                # Check for data from terminal (non-blocking)
-                r, _, _ = select.select([fd], [], [], 0.05)
-                if fd in r:
-                    try:
-                        data = os.read(fd, 8192)
-                        if data:
-                            await websocket.send_text(data.decode("utf-8", errors="replace"))
-                    except OSError:
-                        break
-
-                # Check for data from websocket (with timeout)
-                try:
-                    data = await asyncio.wait_for(websocket.receive_text(), timeout=0.05)
+                done, _ = await asyncio.wait({ws_task, pty_task}, return_when=asyncio.FIRST_COMPLETED)
+
+                if pty_task in done:
+                    # Coalesce whatever else is already queued into the same frame
+                    chunks = [pty_task.result()]
+                    size = len(chunks[0])
+                    while chunks[-1] and size < PTY_BATCH_SIZE and not pty_queue.empty():
+                        chunks.append(pty_queue.get_nowait())
+                        size += len(chunks[-1])
+                    data = b''.join(chunks)
                     if data:
-                        # Check for JSON commands
-                        if data.startswith('{'):
-                            try:
-                                msg = json.loads(data)
-                                if msg.get('type') == 'resize':
-                                    rows = msg.get('rows', 24)
-                                    cols = msg.get('cols', 80)
-                                    set_terminal_size(fd, rows, cols)
-                                elif msg.get('type') == 'ping':
-                                    await websocket.send_text('{"type":"pong"}')
-                            except json.JSONDecodeError:
-                                pass
-                        else:
-                            os.write(fd, data.encode("utf-8"))
-                except asyncio.TimeoutError:
-                    pass
-                except WebSocketDisconnect:
-                    print(f"[Terminal] WebSocket disconnected, cleaning up PTY {pid}")
-                    break
+                        await websocket.send_bytes(data)
+                    if not chunks[-1]:
+                        break
+                    pty_task = asyncio.create_task(pty_queue.get())
+
+                if ws_task in done:
+                    # Take every frame that has already arrived, then write the keystrokes in one go.
+                    # Control frames flush pending input first so ordering is preserved.
+                    pending = bytearray()
+                    disconnected = False
+                    while True:
+                        message = ws_task.result()
+                        if message["type"] == "websocket.disconnect":
+                            disconnected = True
+                            break
+                        ws_task = asyncio.create_task(websocket.receive())
+                        data = message.get("text")
+                        if message.get("bytes"):
+                            pending += message["bytes"]
+                        elif data:
+                            # Check for JSON commands
+                            if data.startswith('{'):
+                                command = parse_terminal_command(data)
+                                if command is not None:
+                                    await write_pty(fd, pending)
+                                    pending.clear()
+                                    if command.get('type') == 'resize':
+                                        set_terminal_size(fd, command.get('rows', 24), command.get('cols', 80))
+                                    elif command.get('type') == 'ping':
+                                        await websocket.send_text(PONG_FRAME)
+                            else:
+                                pending += data.encode("utf-8")
+                        if len(pending) >= PTY_BATCH_SIZE:
+                            break
+                        # Let the next receive run once - if a frame is already waiting it completes
+                        await asyncio.sleep(0)
+                        if not ws_task.done():
+                            break
+                    await write_pty(fd, pending)
+                    if disconnected:
+                        terminal_logger.debug("WebSocket disconnected, cleaning up PTY %s", pid)
+                        break
         finally:
-            # Clean up: close fd and kill the entire process group
-            print(f"[Terminal] Cleaning up PTY process {pid}")
+            # Clean up: stop watching the fd, close it and kill the entire process group
+            terminal_logger.debug("Cleaning up PTY process %s", pid)
+            loop.remove_reader(fd)
+            ws_task.cancel()
+            pty_task.cancel()
             try:
                 os.close(fd)
             except OSError:
                 pass
 
             # Kill the entire process group (bash + all child processes like claude)
-            try:
-                # First try SIGTERM to the process group
-                os.killpg(pid, signal.SIGTERM)
-            except OSError:
-                # Process group might not exist, try killing just the pid
+            kill_process_group(pid, signal.SIGTERM)
+
+            if pidfd is not None:
+                # Wait for the shell to actually exit instead of sleeping a fixed interval
                 try:
-                    os.kill(pid, signal.SIGTERM)
+                    await asyncio.wait_for(exited.wait(), 0.5)
+                except asyncio.TimeoutError:
+                    kill_process_group(pid, signal.SIGKILL)
+                    await exited.wait()
+                # Anything left in the group after the shell is gone gets no further grace
+                kill_process_group(pid, signal.SIGKILL)
+                loop.remove_reader(pidfd)
+                os.close(pidfd)
+                try:
+                    os.waitpid(pid, 0)
                 except OSError:
                     pass
+            else:
+                # Give processes a moment to terminate gracefully
+                await asyncio.sleep(0.5)
 
-            # Give processes a moment to terminate gracefully
-            await asyncio.sleep(0.5)
+                # Force kill if still running
+                kill_process_group(pid, signal.SIGKILL)
 
-            # Force kill if still running
-            try:
-                os.killpg(pid, signal.SIGKILL)
-            except OSError:
+                # Reap zombie process
                 try:
-                    os.kill(pid, signal.SIGKILL)
+                    os.waitpid(pid, os.WNOHANG)
                 except OSError:
                     pass
 
-            # Reap zombie process
-            try:
-                os.waitpid(pid, os.WNOHANG)
-            except OSError:
-                pass
-
-            print(f"[Terminal] PTY process {pid} cleaned up")
+            terminal_logger.debug("PTY process %s cleaned up", pid)
 
 
 # Serve static files (React app)
 
+# index.html bytes and ETag, read once on first request
+_index_html: Optional[tuple[bytes, str]] = None
+
+
+def load_index_html() -> Optional[tuple[bytes, str]]:
+    """Read the built index.html once and keep it with its ETag. Returns None if not built yet."""
+    global _index_html
+    if _index_html is None:
+        try:
+            content = (get_static_dir() / "index.html").read_bytes()
+        except OSError:
+            return None
+        _index_html = (content, '"' + hashlib.md5(content).hexdigest() + '"')
+    return _index_html
+
+
 @app.get("/")
-async def serve_index():
+async def serve_index(if_none_match: Optional[str] = Header(None)):
     """Serve the React app index.html"""
-    static_dir = get_static_dir()
-    index_path = static_dir / "index.html"
+    index = load_index_html()
 
-    if not index_path.exists():
+    if index is None:
         return JSONResponse(
             status_code=503,
             content={
@@ -1623,14 +2376,41 @@ async def serve_index():
             }
         )
 
-    return FileResponse(index_path)
+    content, etag = index
+    # no-cache: the browser revalidates every time, which is a 304 while the build is unchanged
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if if_none_match and (if_none_match.strip() == "*" or etag in if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="text/html", headers=headers)
 
 
-# Mount static files for assets (at module load time)
+# Static assets (at module load time)
 _static_dir = get_static_dir()
 _assets_dir = _static_dir / "assets"
-if _assets_dir.exists():
-    app.mount("/assets", StaticFiles(directory=_assets_dir), name="assets")
+
+# Vite emits content-hashed asset names, so a given asset URL never changes - browsers can skip revalidation
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Requested asset path -> (resolved file, stat result); hashed files are immutable, so one stat each
+_asset_files: dict[str, tuple[Path, os.stat_result]] = {}
+
+
+@app.api_route("/assets/{path:path}", methods=["GET", "HEAD"])
+async def serve_asset(path: str):
+    """Serve a built frontend asset with long-lived cache headers"""
+    cached = _asset_files.get(path)
+    if cached is None:
+        try:
+            file_path = (_assets_dir / path).resolve()
+            file_path.relative_to(_assets_dir.resolve())
+            stat_result = file_path.stat()
+        except (ValueError, OSError):
+            raise HTTPException(status_code=404, detail="Not Found")
+        if not stat.S_ISREG(stat_result.st_mode):
+            raise HTTPException(status_code=404, detail="Not Found")
+        cached = _asset_files[path] = (file_path, stat_result)
+
+    file_path, stat_result = cached
+    return FileResponse(file_path, headers={"Cache-Control": ASSET_CACHE_CONTROL}, stat_result=stat_result)
 
 
 def create_app() -> FastAPI:
@@ -4,31 +4,40 @@ Uses watchdog (native OS events) when available, falls back to polling.
 """
 
 import asyncio
+import functools
+import logging
 import os
+import re
 import threading
 import time
 from pathlib import Path
 from typing import Callable, Optional
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 # Try to import watchdog, fall back to polling if not available
 try:
     from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
     from watchdog.events import FileSystemEventHandler, FileSystemEvent
     WATCHDOG_AVAILABLE = True
 except ImportError:
     WATCHDOG_AVAILABLE = False
     Observer = None
+    PollingObserver = None
     FileSystemEventHandler = object
     FileSystemEvent = None
 
+# Per-event messages are debug-level - an editor save or a bulk copy can produce many
+logger = logging.getLogger("vibefoundry.watcher")
+
 
 @dataclass
 class FileState:
-    """Tracks file modification times for polling mode"""
-    input_files: dict[str, float] = field(default_factory=dict)
-    output_files: dict[str, float] = field(default_factory=dict)
-    script_files: dict[str, float] = field(default_factory=dict)
+    """Tracks file modification times (st_mtime_ns) for polling mode"""
+    input_files: dict[str, int] = field(default_factory=dict)
+    output_files: dict[str, int] = field(default_factory=dict)
+    script_files: dict[str, int] = field(default_factory=dict)
 
 
 @dataclass
@@ -48,32 +57,62 @@ IGNORE_PATTERNS = [
 ]
 
 
+# All ignore patterns as one regex - a single scan instead of one substring test per pattern
+_IGNORE_RE = re.compile('|'.join(re.escape(pattern) for pattern in IGNORE_PATTERNS))
+
+
+@functools.lru_cache(maxsize=4096)
+def _ignore_name(name: str) -> bool:
+    """Check a file name (not a path) against the ignore patterns"""
+    name = name.lower()
+    return name.startswith('.') or _IGNORE_RE.search(name) is not None
+
+
+def _skip_dir(name: str) -> bool:
+    """Directories the polling scan doesn't descend into"""
+    return name.startswith('.') or name == '__pycache__'
+
+
 def should_ignore(path: str) -> bool:
     """Check if this file should be ignored"""
-    name = Path(path).name.lower()
-    for pattern in IGNORE_PATTERNS:
-        if pattern in name:
-            return True
-    if name.startswith('.'):
-        return True
-    return False
+    return _ignore_name(os.path.basename(path))
 
 
-class FolderHandler(FileSystemEventHandler):
-    """Handler for watchdog file system events"""
+# Callbacks fire this long after the first event of a burst (seconds)
+COALESCE_DELAY = 0.15
 
-    def __init__(self, folder_type: str, on_change: Optional[Callable[[FileChange], None]] = None):
-        self.folder_type = folder_type
+
+class FolderHandler(FileSystemEventHandler):
+    """Handler for watchdog file system events, shared by all watched folders"""
+
+    def __init__(self, folders: list[tuple[Path, str]], on_change: Optional[Callable[[FileChange], None]] = None):
+        # (folder path + separator, folder type), longest first so nested folders match first.
+        # Resolved paths are included too since some backends (FSEvents) report real paths.
+        prefixes = set()
+        for folder, folder_type in folders:
+            prefixes.add((os.path.join(str(folder), ""), folder_type))
+            prefixes.add((os.path.join(str(folder.resolve()), ""), folder_type))
+        self._prefixes = sorted(prefixes, key=lambda item: len(item[0]), reverse=True)
         self.on_change = on_change
-        self._recent_events: dict[str, float] = {}
+        self._recent_events: OrderedDict[str, float] = OrderedDict()
         self._lock = threading.Lock()
 
+    def _folder_type(self, path: str) -> Optional[str]:
+        """Which watched folder a path belongs to"""
+        for prefix, folder_type in self._prefixes:
+            if path.startswith(prefix):
+                return folder_type
+        return None
+
     def _handle_event(self, event, change_type: str):
         if event.is_directory:
             return
         path = event.src_path
         if should_ignore(path):
             return
+        folder_type = self._folder_type(path)
+        if folder_type is None:
+            return
 
         # Normalize path for debounce key (Windows can report same file with different casing)
         debounce_key = os.path.normcase(os.path.normpath(path))
@@ -81,13 +120,20 @@ class FolderHandler(FileSystemEventHandler):
         # Debounce (3 seconds to catch Windows rapid file events)
         now = time.time()
         with self._lock:
-            if now - self._recent_events.get(debounce_key, 0) < 3.0:
+            recent = self._recent_events
+            if now - recent.get(debounce_key, 0) < 3.0:
                 return
-            self._recent_events[debounce_key] = now
-            self._recent_events = {k: v for k, v in self._recent_events.items() if now - v < 10.0}
+            recent[debounce_key] = now
+            recent.move_to_end(debounce_key)
+            # Oldest entries are at the front - drop the expired ones
+            while recent:
+                key, last = next(iter(recent.items()))
+                if now - last < 10.0:
+                    break
+                del recent[key]
 
         if self.on_change:
-            self.on_change(FileChange(path=path, change_type=change_type, folder_type=self.folder_type))
+            self.on_change(FileChange(path=path, change_type=change_type, folder_type=folder_type))
 
     def on_created(self, event):
         self._handle_event(event, "created")
@@ -111,7 +157,8 @@ class FileWatcher:
         on_data_change: Optional[Callable[[], None]] = None,
         on_script_change: Optional[Callable[[Path], None]] = None,
         on_output_file_change: Optional[Callable[[Path, str], None]] = None,
-        poll_interval: float = 2.0
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 60.0
     ):
         self.project_folder = project_folder
         self.input_folder = project_folder / "input_folder"
@@ -122,121 +169,197 @@ class FileWatcher:
         self.on_script_change = on_script_change
         self.on_output_file_change = on_output_file_change
         self.poll_interval = poll_interval
+        # Polling backs off towards this while nothing changes
+        self.max_poll_interval = max_poll_interval
+        self._idle_cycles = 0
+
+        self._dispatch_data_change = self._make_dispatcher(on_data_change)
+        self._dispatch_script_change = self._make_dispatcher(on_script_change)
+        self._dispatch_output_file_change = self._make_dispatcher(on_output_file_change)
 
         self._observer = None
         self._running = False
         self._loop = None
         self._task = None
         self._use_polling = False
+        # Coalesced callbacks waiting to fire: key -> latest arguments
+        self._pending: dict = {}
         self.state = FileState()
 
-    def _safe_callback(self, callback, *args):
-        """Safely call a callback from watchdog thread"""
+    def _make_dispatcher(self, callback):
+        """Decide once how a callback is invoked. Coroutine functions are scheduled on the
+        event loop (thread-safe), plain functions are called directly."""
         if callback is None:
-            return
-        try:
-            result = callback(*args)
-            if asyncio.iscoroutine(result) and self._loop:
-                asyncio.run_coroutine_threadsafe(result, self._loop)
-        except Exception as e:
-            print(f"Watcher callback error: {e}")
+            return None
+
+        if asyncio.iscoroutinefunction(callback):
+            def dispatch(*args):
+                if self._loop:
+                    asyncio.run_coroutine_threadsafe(callback(*args), self._loop)
+        else:
+            def dispatch(*args):
+                try:
+                    callback(*args)
+                except Exception as e:
+                    print(f"Watcher callback error: {e}")
+        return dispatch
 
     def _handle_change(self, change: FileChange):
         """Route change events to callbacks"""
-        print(f"[Watcher] {change.change_type} in {change.folder_type}: {change.path}")
+        logger.debug("%s in %s: %s", change.change_type, change.folder_type, change.path)
         if change.folder_type == "input":
-            self._safe_callback(self.on_data_change)
+            self._coalesce("data", self._dispatch_data_change)
         elif change.folder_type == "output":
-            self._safe_callback(self.on_data_change)
+            self._coalesce("data", self._dispatch_data_change)
             if change.change_type in ("created", "modified"):
-                self._safe_callback(self.on_output_file_change, Path(change.path), change.change_type)
+                self._coalesce(("output", change.path), self._dispatch_output_file_change, Path(change.path), change.change_type)
         elif change.folder_type == "scripts":
             if change.change_type in ("created", "modified"):
-                self._safe_callback(self.on_script_change, Path(change.path))
+                self._coalesce(("script", change.path), self._dispatch_script_change, Path(change.path))
 
-    def _scan_folder(self, folder: Path) -> dict[str, float]:
+    def _coalesce(self, key, dispatch, *args):
+        """Dispatch a callback after a short delay, collapsing repeats of the same key in the meantime.
+        An editor save is often several events within a few ms - the callbacks should fire once."""
+        if dispatch is None:
+            return
+        if self._loop is None:
+            dispatch(*args)
+            return
+        # All bookkeeping happens on the event loop thread
+        self._loop.call_soon_threadsafe(self._schedule, key, dispatch, args)
+
+    def _schedule(self, key, dispatch, args):
+        """Queue a coalesced callback (runs on the event loop)"""
+        if key not in self._pending:
+            self._loop.call_later(COALESCE_DELAY, self._fire, key, dispatch)
+        # The latest arguments win
+        self._pending[key] = args
+
+    def _fire(self, key, dispatch):
+        """Run a coalesced callback (runs on the event loop)"""
+        args = self._pending.pop(key)
+        if self._running:
+            dispatch(*args)
+
+    def _scan_folder(self, folder: Path) -> dict[str, int]:
         """Scan folder for polling mode"""
         result = {}
-        if folder.exists():
-            for f in folder.glob("**/*"):
-                if f.is_file() and not should_ignore(str(f)):
+        # os.scandir gets file types from the directory listing itself, so only files need a stat.
+        # Hidden directories (.git, ...) and __pycache__ are never descended into.
+        pending = [str(folder)]
+        while pending:
+            try:
+                entries = os.scandir(pending.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
                     try:
-                        result[str(f)] = f.stat().st_mtime
-                    except (OSError, FileNotFoundError):
+                        if entry.is_dir(follow_symlinks=False):
+                            if not _skip_dir(entry.name):
+                                pending.append(entry.path)
+                        elif entry.is_file() and not _ignore_name(entry.name):
+                            result[entry.path] = entry.stat().st_mtime_ns
+                    except OSError:
                         pass
         return result
 
     def _detect_changes(self, old: dict, new: dict, folder_type: str) -> list[FileChange]:
         """Detect changes for polling mode"""
-        changes = []
-        for path, mtime in new.items():
-            if path not in old:
-                changes.append(FileChange(path, "created", folder_type))
-            elif old[path] != mtime:
-                changes.append(FileChange(path, "modified", folder_type))
-        for path in old:
-            if path not in new:
-                changes.append(FileChange(path, "deleted", folder_type))
+        # Nothing changed (the usual case) - one C-level dict comparison
+        if old == new:
+            return []
+        changes = [FileChange(path, "created", folder_type) for path in new.keys() - old.keys()]
+        changes.extend(
+            FileChange(path, "modified", folder_type)
+            for path, mtime in new.items() if old.get(path, mtime) != mtime
+        )
+        changes.extend(FileChange(path, "deleted", folder_type) for path in old.keys() - new.keys())
         return changes
 
+    def _scan_all(self) -> tuple[dict[str, int], dict[str, int], dict[str, int]]:
+        """Scan the input, output and scripts folders"""
+        return (
+            self._scan_folder(self.input_folder),
+            self._scan_folder(self.output_folder),
+            self._scan_folder(self.scripts_folder)
+        )
+
     def scan_initial_state(self):
         """Initial scan for polling mode"""
         if self._use_polling:
-            self.state.input_files = self._scan_folder(self.input_folder)
-            self.state.output_files = self._scan_folder(self.output_folder)
-            self.state.script_files = self._scan_folder(self.scripts_folder)
+            self.state.input_files, self.state.output_files, self.state.script_files = self._scan_all()
 
     async def _poll_loop(self):
         """Polling loop fallback"""
         while self._running:
             try:
-                new_input = self._scan_folder(self.input_folder)
-                new_output = self._scan_folder(self.output_folder)
-                new_scripts = self._scan_folder(self.scripts_folder)
-
-                for change in self._detect_changes(self.state.input_files, new_input, "input"):
-                    self._handle_change(change)
-                for change in self._detect_changes(self.state.output_files, new_output, "output"):
-                    self._handle_change(change)
-                for change in self._detect_changes(self.state.script_files, new_scripts, "scripts"):
+                # Walking the trees is blocking I/O - keep it off the event loop
+                new_input, new_output, new_scripts = await asyncio.to_thread(self._scan_all)
+
+                changes = (
+                    self._detect_changes(self.state.input_files, new_input, "input")
+                    + self._detect_changes(self.state.output_files, new_output, "output")
+                    + self._detect_changes(self.state.script_files, new_scripts, "scripts")
+                )
+                for change in changes:
                     self._handle_change(change)
 
                 self.state.input_files = new_input
                 self.state.output_files = new_output
                 self.state.script_files = new_scripts
+
+                # Poll fast while things are changing, back off exponentially while idle
+                self._idle_cycles = 0 if changes else min(self._idle_cycles + 1, 32)
             except Exception as e:
                 print(f"Poll error: {e}")
 
-            await asyncio.sleep(self.poll_interval)
+            await asyncio.sleep(self._next_poll_interval())
+
+    def _next_poll_interval(self) -> float:
+        """Polling interval after the current number of idle cycles"""
+        return max(min(self.poll_interval * (1.5 ** self._idle_cycles), self.max_poll_interval), self.poll_interval)
 
     def _try_start_watchdog(self) -> bool:
-        """Try to start watchdog, return True if successful"""
+        """Try to start watchdog, return True if successful.
+        Native OS events are tried first, then watchdog's own polling observer."""
         if not WATCHDOG_AVAILABLE:
             return False
 
+        if self._start_observer(Observer):
+            return True
+        return self._start_observer(lambda: PollingObserver(timeout=self.poll_interval))
+
+    def _start_observer(self, make_observer) -> bool:
+        """Start one kind of watchdog observer, return True if successful"""
         try:
-            self._observer = Observer()
-
-            for folder, folder_type in [
-                (self.input_folder, "input"),
-                (self.output_folder, "output"),
-                (self.scripts_folder, "scripts")
-            ]:
-                # Only watch folders that exist - don't auto-create
-                if folder.exists():
-                    handler = FolderHandler(folder_type, self._handle_change)
-                    self._observer.schedule(handler, str(folder), recursive=True)
+            self._observer = make_observer()
+
+            # Only watch folders that exist - don't auto-create
+            folders = [
+                (folder, folder_type) for folder, folder_type in [
+                    (self.input_folder, "input"),
+                    (self.output_folder, "output"),
+                    (self.scripts_folder, "scripts")
+                ]
+                if folder.exists()
+            ]
+            # One handler for all folders - it works out the folder type from the event path
+            handler = FolderHandler(folders, self._handle_change)
+            for folder, _ in folders:
+                self._observer.schedule(handler, str(folder), recursive=True)
 
             self._observer.start()
 
             # Quick test - if it started, give it a moment to fail if it's going to
             time.sleep(0.1)
             if not self._observer.is_alive():
+                self._observer = None
                 return False
 
             return True
         except Exception as e:
-            print(f"Watchdog failed, using polling: {e}")
+            print(f"Watchdog observer failed: {e}")
             if self._observer:
                 try:
                     self._observer.stop()
@@ -259,7 +382,10 @@ class FileWatcher:
         # Try watchdog first
         if self._try_start_watchdog():
             self._use_polling = False
-            print("File watcher: using native OS events")
+            if isinstance(self._observer, PollingObserver):
+                print("File watcher: using watchdog polling")
+            else:
+                print("File watcher: using native OS events")
         else:
             self._use_polling = True
             self.scan_initial_state()
@@ -275,12 +401,12 @@ class FileWatcher:
             self._task = asyncio.create_task(self._poll_loop())
 
     def stop(self):
-        """Stop watching"""
+        """Stop watching. Doesn't wait for the observer thread to exit - use stop_async for that."""
         self._running = False
         if self._observer:
             try:
+                # Stopping also unschedules all watches; the thread winds down in the background
                 self._observer.stop()
-                self._observer.join(timeout=1.0)
             except:
                 pass
             self._observer = None
@@ -288,6 +414,15 @@ class FileWatcher:
             self._task.cancel()
             self._task = None
 
+    async def stop_async(self):
+        """Stop watching and wait for the observer thread and polling task to finish"""
+        observer, task = self._observer, self._task
+        self.stop()
+        if observer:
+            await asyncio.to_thread(observer.join, 1.0)
+        if task:
+            await asyncio.gather(task, return_exceptions=True)
+
     def check_once(self):
         """For compatibility - returns empty lists"""
         return [], [], []